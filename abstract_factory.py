@@ -1,6 +1,8 @@
 # abstract_factory.py - Implementación del patrón Abstract Factory
 
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Optional
 from resources import (
     NetworkResource, StorageResource, VMResource,
     AWSNetwork, AWSStorage, AWSVM,
@@ -101,27 +103,56 @@ class OnPremiseResourceFactory(CloudResourceFactory):
 class AbstractFactoryRegistry:
     """Registro de factories para diferentes proveedores"""
     
-    _factories = {
+    # Factories incluidas (solo lectura) y factories registradas en ejecución
+    _builtin_factories = MappingProxyType({
         'aws': AWSResourceFactory,
         'azure': AzureResourceFactory,
         'gcp': GCPResourceFactory,
         'onpremise': OnPremiseResourceFactory
-    }
+    })
+    _extra_factories: dict[str, type] = {}
+    
+    # Las factories no guardan estado: se reutiliza una instancia por proveedor
+    _instances: dict[str, CloudResourceFactory] = {}
+    
+    @classmethod
+    def find_factory(cls, provider_name: str) -> Optional[CloudResourceFactory]:
+        """Obtener factory del proveedor especificado, o None si no está soportado"""
+        key = provider_name.lower()
+        factory = cls._instances.get(key)
+        if factory is not None:
+            return factory
+        factory_class = cls._extra_factories.get(key) or cls._builtin_factories.get(key)
+        if not factory_class:
+            return None
+        factory = cls._instances[key] = factory_class()
+        return factory
     
     @classmethod
     def get_factory(cls, provider_name: str) -> CloudResourceFactory:
         """Obtener factory del proveedor especificado"""
-        factory_class = cls._factories.get(provider_name.lower())
-        if not factory_class:
+        factory = cls.find_factory(provider_name)
+        if factory is None:
             raise ValueError(f"Proveedor '{provider_name}' no soportado")
-        return factory_class()
+        return factory
     
     @classmethod
     def register_factory(cls, provider_name: str, factory_class: type):
         """Registrar una nueva factory para extensibilidad"""
-        cls._factories[provider_name.lower()] = factory_class
+        key = provider_name.lower()
+        cls._extra_factories[key] = factory_class
+        cls._instances.pop(key, None)
+    
+    @classmethod
+    def unregister_factory(cls, provider_name: str) -> bool:
+        """Eliminar una factory registrada en ejecución; si reemplazaba a una incluida, esta vuelve a usarse"""
+        key = provider_name.lower()
+        cls._instances.pop(key, None)
+        return cls._extra_factories.pop(key, None) is not None
     
     @classmethod
     def get_supported_providers(cls) -> list[str]:
         """Obtener lista de proveedores soportados"""
-        return list(cls._factories.keys())
\ No newline at end of file
+        providers = list(cls._builtin_factories)
+        providers.extend(name for name in cls._extra_factories if name not in cls._builtin_factories)
+        return providers
\ No newline at end of file
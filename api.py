@@ -1,6 +1,16 @@
+import time
 from fastapi import FastAPI, HTTPException
-from models import VMRequest, VMResponse, ResourceFamilyRequest, ResourceFamilyResponse
-from models_extended import BuilderRequest, BuilderResponse, VMType, Provider
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from models import (
+    VMRequest, VMResponse, ResourceFamilyRequest, ResourceFamilyResponse,
+    ResourceFamilyBatchRequest, ResourceFamilyBatchResponse
+)
+from models_extended import (
+    BuilderRequest, BuilderResponse, BuilderBatchRequest, BuilderBatchResponse,
+    VMType, Provider
+)
 from prototype_models import (
     TemplateCreationRequest, TemplateCreationResponse,
     TemplateRegistrationRequest, TemplateRegistrationResponse,
@@ -25,17 +35,36 @@ provisioning_service = ResourceProvisioningService()
 construction_service = VMConstructionService()
 prototype_service = VMPrototypeService()
 
+# Valores de VMType calculados una sola vez al importar
+VM_TYPE_VALUES = [vm_type.value for vm_type in VMType]
+
+# Cache en memoria para endpoints de configuración de solo lectura.
+# Guarda el JSON ya serializado para no recodificarlo en cada request.
+CONFIG_CACHE_TTL_SECONDS = 300
+_config_cache = {}
+
+def _get_cached(key, builder):
+    """Retorna la respuesta JSON cacheada para `key` o la reconstruye si expiró"""
+    now = time.monotonic()
+    entry = _config_cache.get(key)
+    if entry is not None and entry[0] > now:
+        body = entry[1]
+    else:
+        body = JSONResponse(jsonable_encoder(builder())).body
+        _config_cache[key] = (now + CONFIG_CACHE_TTL_SECONDS, body)
+    return Response(content=body, media_type="application/json")
+
 # ============= ENDPOINT ORIGINAL (MANTENIDO PARA COMPATIBILIDAD) =============
 
 @app.post("/provision_vm", response_model=VMResponse, tags=["VM Individual"])
-def provision_vm(request: VMRequest):
+async def provision_vm(request: VMRequest):
     """Aprovisiona una VM individual (endpoint original)"""
-    provider_name = request.provider.lower()
+    provider_name = request.provider
     params = request.params
     safe_log(f"Solicitud aprovisionamiento VM individual {provider_name}", params)
     try:
         provider = VMFactory.get_provider(provider_name)
-        success, vm_id, error = provider.create_vm(params)
+        success, vm_id, error = await run_in_threadpool(provider.create_vm, params)
         if success:
             return VMResponse(success=True, vm_id=vm_id)
         else:
@@ -46,26 +75,53 @@ def provision_vm(request: VMRequest):
 # ============= NUEVO ENDPOINT PARA FAMILIAS DE RECURSOS =============
 
 @app.post("/provision_resource_family", response_model=ResourceFamilyResponse, tags=["Familia de Recursos"])
-def provision_resource_family(request: ResourceFamilyRequest):
+async def provision_resource_family(request: ResourceFamilyRequest):
     """Aprovisiona una familia completa de recursos (VM + Red + Disco) de forma consistente"""
-    return provisioning_service.provision_resource_family(
+    return await run_in_threadpool(
+        provisioning_service.provision_resource_family,
         provider=request.provider,
         vm_params=request.vm_params,
         network_params=request.network_params,
         storage_params=request.storage_params
     )
 
+@app.post("/provision_resource_family_batch", response_model=ResourceFamilyBatchResponse, tags=["Familia de Recursos"])
+async def provision_resource_family_batch(request: ResourceFamilyBatchRequest):
+    """Aprovisiona varias familias de recursos en una sola llamada, de forma concurrente"""
+    results = await run_in_threadpool(
+        provisioning_service.provision_many,
+        request.families
+    )
+    return ResourceFamilyBatchResponse.model_construct(results=results)
+
 # ============= NUEVO ENDPOINT PARA BUILDER PATTERN =============
 
 @app.post("/build_vm", response_model=BuilderResponse, tags=["Builder Pattern"])
-def build_vm(request: BuilderRequest):
+async def build_vm(request: BuilderRequest):
     """Construye una VM usando Director + Builder pattern con configuraciones predefinidas"""
-    return construction_service.build_vm_from_request(request)
+    return await run_in_threadpool(construction_service.build_vm_from_request, request)
+
+@app.post("/build_vm_batch", response_model=BuilderBatchResponse, tags=["Builder Pattern"])
+async def build_vm_batch(request: BuilderBatchRequest):
+    """Construye varias VMs en una sola llamada, de forma concurrente"""
+    results = await run_in_threadpool(construction_service.build_vms_from_requests, request.requests)
+    return BuilderBatchResponse.model_construct(results=results)
+
+@app.get("/vm_configurations", tags=["Builder Pattern"])
+async def get_all_vm_configurations():
+    """Obtiene en una sola respuesta las configuraciones de todos los proveedores"""
+    return _get_cached("vm_configurations", lambda: {
+        provider.value: construction_service.get_available_configurations(provider)
+        for provider in Provider
+    })
 
 @app.get("/vm_configurations/{provider}", tags=["Builder Pattern"])
-def get_vm_configurations(provider: Provider):
+async def get_vm_configurations(provider: Provider):
     """Obtiene las configuraciones disponibles para un proveedor específico"""
-    return construction_service.get_available_configurations(provider)
+    return _get_cached(
+        ("vm_configurations", provider.value),
+        lambda: construction_service.get_available_configurations(provider)
+    )
 
 @app.post("/validate_vm_config", tags=["Builder Pattern"])
 def validate_vm_configuration(
@@ -78,18 +134,18 @@ def validate_vm_configuration(
     return construction_service.validate_configuration(provider, vm_type, region, flavor)
 
 @app.get("/supported_providers", tags=["Información"])
-def get_supported_providers():
+async def get_supported_providers():
     """Obtiene la lista de proveedores soportados"""
-    return {
+    return _get_cached("supported_providers", lambda: {
         "providers": provisioning_service.get_supported_providers(),
-        "vm_types": [vm_type.value for vm_type in VMType],
+        "vm_types": VM_TYPE_VALUES,
         "message": "Proveedores disponibles para aprovisionamiento de recursos"
-    }
+    })
 
 # ============= ENDPOINTS PARA PATRÓN PROTOTYPE =============
 
 @app.post("/create_from_template", response_model=TemplateCreationResponse, tags=["Prototype Pattern"])
-def create_vm_from_template(request: TemplateCreationRequest):
+async def create_vm_from_template(request: TemplateCreationRequest):
     """Crea una VM a partir de un template existente con personalizaciones opcionales"""
     safe_log(f"API: Creando VM desde template '{request.template_name}'", {
         "provider": request.provider,
@@ -101,21 +157,20 @@ def create_vm_from_template(request: TemplateCreationRequest):
         ])
     })
     
-    # Consolidar personalizaciones
-    customizations = {}
-    if request.vm_customizations:
-        customizations["vm_config"] = request.vm_customizations
-    if request.network_customizations:
-        customizations["network_config"] = request.network_customizations
-    if request.storage_customizations:
-        customizations["storage_config"] = request.storage_customizations
-    if request.additional_tags:
-        customizations["tags"] = request.additional_tags
-    if request.region:
-        customizations["region"] = request.region
+    # Consolidar personalizaciones (solo las que vienen informadas)
+    customizations = {
+        key: value for key, value in (
+            ("vm_config", request.vm_customizations),
+            ("network_config", request.network_customizations),
+            ("storage_config", request.storage_customizations),
+            ("tags", request.additional_tags),
+            ("region", request.region)
+        ) if value
+    }
     
     # Crear VM usando el servicio de prototipos
-    result = prototype_service.create_from_template(
+    result = await run_in_threadpool(
+        prototype_service.create_from_template,
         template_name=request.template_name,
         provider=request.provider,
         region=request.region,
@@ -124,7 +179,7 @@ def create_vm_from_template(request: TemplateCreationRequest):
     
     # Convertir BuilderResponse a TemplateCreationResponse
     if result.success:
-        return TemplateCreationResponse(
+        return TemplateCreationResponse.model_construct(
             success=True,
             template_name=request.template_name,
             vm_specification=result.vm_specification,
@@ -132,7 +187,7 @@ def create_vm_from_template(request: TemplateCreationRequest):
             cost_estimate=None  # TODO: Agregar estimación de costo
         )
     else:
-        return TemplateCreationResponse(
+        return TemplateCreationResponse.model_construct(
             success=False,
             error=result.error
         )
@@ -153,7 +208,7 @@ def register_vm_template(request: TemplateRegistrationRequest):
         tags=request.tags
     )
     
-    return TemplateRegistrationResponse(
+    return TemplateRegistrationResponse.model_construct(
         success=result["success"],
         template_name=request.template_name if result["success"] else None,
         template_info=result.get("template_info"),
@@ -168,7 +223,7 @@ def list_vm_templates(category: str = None):
     
     result = prototype_service.list_available_templates(category)
     
-    return TemplateListResponse(
+    return TemplateListResponse.model_construct(
         success=result["success"],
         templates=result.get("templates"),
         total=result.get("total"),
@@ -184,7 +239,7 @@ def get_template_details(template_name: str):
     
     result = prototype_service.get_template_details(template_name)
     
-    return TemplateDetailsResponse(
+    return TemplateDetailsResponse.model_construct(
         success=result["success"],
         template_info=result.get("template_info"),
         vm_specification=result.get("vm_specification"),
@@ -200,7 +255,7 @@ def delete_vm_template(template_name: str):
     
     result = prototype_service.delete_template(template_name)
     
-    return TemplateDeletionResponse(
+    return TemplateDeletionResponse.model_construct(
         success=result["success"],
         message=result.get("message"),
         error=result.get("error")
@@ -219,7 +274,7 @@ def create_template_from_existing_vm(request: TemplateFromVMRequest):
         tags=request.tags
     )
     
-    return TemplateRegistrationResponse(
+    return TemplateRegistrationResponse.model_construct(
         success=result["success"],
         template_name=request.template_name if result["success"] else None,
         template_info=result.get("template_info"),
@@ -239,7 +294,7 @@ def validate_vm_template(request: TemplateValidationRequest):
     template_details = prototype_service.get_template_details(request.template_name)
     
     if not template_details["success"]:
-        return TemplateValidationResponse(
+        return TemplateValidationResponse.model_construct(
             success=False,
             error=template_details["error"]
         )
@@ -264,7 +319,7 @@ def validate_vm_template(request: TemplateValidationRequest):
     # Validación exitosa si todos los checks pasan
     is_valid = all(validation_results.values())
     
-    return TemplateValidationResponse(
+    return TemplateValidationResponse.model_construct(
         success=True,
         is_valid=is_valid,
         validation_results=validation_results,
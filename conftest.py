@@ -0,0 +1,39 @@
+"""
+Fixtures compartidas por los tests de la API
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Cliente HTTP único para toda la sesión; el lifespan de la app se ejecuta una sola vez"""
+    # Import diferido: la app solo se construye si algún test usa el cliente
+    from api import app
+
+    with TestClient(app) as c:
+        # Precalentamiento: genera el esquema OpenAPI antes del primer test
+        c.get("/openapi.json")
+        yield c
+
+
+@pytest.fixture(scope="session")
+def cached_get(client):
+    """GET memoizado por URL para endpoints de solo lectura; retorna (status_code, json).
+    No usar con endpoints que modifican estado."""
+    cache = {}
+
+    def _get(url):
+        if url not in cache:
+            response = client.get(url)
+            cache[url] = (response.status_code, response.json())
+        return cache[url]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def all_configs(cached_get):
+    """Configuraciones de todos los proveedores obtenidas con una sola llamada"""
+    return cached_get("/vm_configurations")[1]
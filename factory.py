@@ -1,23 +1,35 @@
-from providers.aws import AWSProvider
-from providers.azure import AzureProvider
-from providers.gcp import GCPProvider
-from providers.onpremise import OnPremiseProvider
+from importlib import import_module
+from types import MappingProxyType
 
 class VMFactory:
-    _providers = {
-        'aws': AWSProvider,
-        'azure': AzureProvider,
-        'gcp': GCPProvider,
-        'onpremise': OnPremiseProvider
-    }
+    # Proveedores incluidos (solo lectura) como "módulo:Clase"; se importan al primer uso
+    _builtin_providers = MappingProxyType({
+        'aws': 'providers.aws:AWSProvider',
+        'azure': 'providers.azure:AzureProvider',
+        'gcp': 'providers.gcp:GCPProvider',
+        'onpremise': 'providers.onpremise:OnPremiseProvider'
+    })
+    # Proveedores registrados en ejecución
+    _extra_providers = {}
+    # Los proveedores no guardan estado: se crea una sola instancia por nombre
+    _instances = {}
 
     @classmethod
     def get_provider(cls, name):
-        provider_cls = cls._providers.get(name)
+        provider = cls._instances.get(name)
+        if provider is not None:
+            return provider
+        provider_cls = cls._extra_providers.get(name)
         if not provider_cls:
-            raise ValueError(f"Proveedor '{name}' no soportado")
-        return provider_cls()
+            provider_path = cls._builtin_providers.get(name)
+            if not provider_path:
+                raise ValueError(f"Proveedor '{name}' no soportado")
+            module_name, class_name = provider_path.split(":")
+            provider_cls = getattr(import_module(module_name), class_name)
+        provider = cls._instances[name] = provider_cls()
+        return provider
 
     @classmethod
     def register_provider(cls, name, provider_cls):
-        cls._providers[name] = provider_cls
+        cls._extra_providers[name] = provider_cls
+        cls._instances.pop(name, None)
@@ -3,8 +3,19 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("vm_api")
 
-SENSITIVE_KEYS = {"password", "token", "secret", "key"}
+SENSITIVE_KEYS = frozenset({"password", "token", "secret", "key"})
 
-def safe_log(msg, params):
-    filtered = {k: ("***" if k.lower() in SENSITIVE_KEYS else v) for k, v in params.items()}
-    logger.info(f"{msg}: {filtered}")
+def log_enabled():
+    """Indica si safe_log va a emitir; permite no armar mensaje ni parámetros en vano"""
+    return logger.isEnabledFor(logging.INFO)
+
+def safe_log(msg, params=None):
+    if not log_enabled():
+        return
+    params = params or {}
+    # Solo se reconstruye el diccionario si contiene alguna clave sensible
+    if SENSITIVE_KEYS.isdisjoint(map(str.lower, params)):
+        filtered = params
+    else:
+        filtered = {k: ("***" if k.lower() in SENSITIVE_KEYS else v) for k, v in params.items()}
+    logger.info("%s: %s", msg, filtered)
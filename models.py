@@ -1,10 +1,13 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict
+from typing import Annotated, Optional, Dict, Any
+
+# Nombre de proveedor normalizado a minúsculas una sola vez al validar el request
+ProviderName = Annotated[str, AfterValidator(str.lower)]
 
 # ============= MODELOS ORIGINALES (MANTENIDOS PARA COMPATIBILIDAD) =============
 
 class VMRequest(BaseModel):
-    provider: str
+    provider: ProviderName
     params: dict
 
 class VMResponse(BaseModel):
@@ -16,7 +19,7 @@ class VMResponse(BaseModel):
 
 class ResourceFamilyRequest(BaseModel):
     """Modelo para solicitud de aprovisionamiento de familia de recursos"""
-    provider: str
+    provider: ProviderName
     vm_params: dict
     network_params: dict
     storage_params: dict
@@ -35,6 +38,13 @@ class ResourceFamilyResponse(BaseModel):
     resources: Optional[list[ResourceInfo]] = None
     error: Optional[str] = None
     
-    class Config:
-        # Permite usar list[ResourceInfo] en lugar de List[ResourceInfo]
-        arbitrary_types_allowed = True
+    # Permite usar list[ResourceInfo] en lugar de List[ResourceInfo]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+class ResourceFamilyBatchRequest(BaseModel):
+    """Solicitud de aprovisionamiento de varias familias de recursos en una sola llamada"""
+    families: list[ResourceFamilyRequest]
+
+class ResourceFamilyBatchResponse(BaseModel):
+    """Resultados del aprovisionamiento en lote, en el mismo orden de la solicitud"""
+    results: list[ResourceFamilyResponse]
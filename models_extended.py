@@ -3,7 +3,7 @@ Modelos de datos extendidos para el patrón Builder con Director.
 Incluye los nuevos atributos obligatorios y opcionales para VM, Network y Storage.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any, Literal
 from enum import Enum
 
@@ -119,8 +119,15 @@ class BuilderResponse(BaseModel):
     created_resources: Optional[List[Dict[str, Any]]] = None
     error: Optional[str] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+class BuilderBatchRequest(BaseModel):
+    """Solicitud de construcción de varias VMs en una sola llamada"""
+    requests: List[BuilderRequest]
+
+class BuilderBatchResponse(BaseModel):
+    """Resultados de la construcción en lote, en el mismo orden de la solicitud"""
+    results: List[BuilderResponse]
 
 # ============= MODELOS ORIGINALES (MANTENIDOS PARA COMPATIBILIDAD) =============
 
@@ -154,5 +161,4 @@ class ResourceFamilyResponse(BaseModel):
     resources: Optional[List[ResourceInfo]] = None
     error: Optional[str] = None
     
-    class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+    model_config = ConfigDict(arbitrary_types_allowed=True)
\ No newline at end of file
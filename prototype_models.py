@@ -3,7 +3,7 @@ Modelos específicos para el patrón Prototype.
 Define las estructuras de datos para requests y responses de templates.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from models_extended import VMSpecification, Provider, VMType
 
@@ -32,8 +32,7 @@ class TemplateCreationResponse(BaseModel):
     cost_estimate: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class TemplateRegistrationRequest(BaseModel):
@@ -1,9 +1,7 @@
-class AWSProvider:
-    def create_vm(self, params):
-        # Validación específica AWS
-        required = ["instance_type", "region", "vpc", "ami"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro AWS: {r}"
-        # Simulación de creación
-        return True, "aws-vm-123", None
+from providers.base import RequiredParamsProvider
+
+class AWSProvider(RequiredParamsProvider):
+    # Validación específica AWS
+    required_params = frozenset({"instance_type", "region", "vpc", "ami"})
+    label = "AWS"
+    vm_id = "aws-vm-123"
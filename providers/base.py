@@ -0,0 +1,12 @@
+class RequiredParamsProvider:
+    """Proveedor de VM que solo valida parámetros requeridos y retorna un id simulado"""
+    required_params = frozenset()
+    label = ""
+    vm_id = ""
+
+    def create_vm(self, params):
+        missing = self.required_params - params.keys()
+        if missing:
+            return False, None, f"Falta parámetro {self.label}: {', '.join(sorted(missing))}"
+        # Simulación de creación
+        return True, self.vm_id, None
@@ -1,7 +1,6 @@
-class OnPremiseProvider:
-    def create_vm(self, params):
-        required = ["cpu", "ram", "disk", "network"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro OnPremise: {r}"
-        return True, "onprem-vm-001", None
+from providers.base import RequiredParamsProvider
+
+class OnPremiseProvider(RequiredParamsProvider):
+    required_params = frozenset({"cpu", "ram", "disk", "network"})
+    label = "OnPremise"
+    vm_id = "onprem-vm-001"
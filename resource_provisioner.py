@@ -1,14 +1,35 @@
 # resource_provisioner.py - Servicio de aprovisionamiento de familias de recursos
 
+from concurrent.futures import ThreadPoolExecutor
 from abstract_factory import AbstractFactoryRegistry, CloudResourceFactory
-from resources import NetworkResource, StorageResource, VMResource
-from models import ResourceInfo, ResourceFamilyResponse
+from resources import (
+    NetworkResource, StorageResource, VMResource,
+    STATUS_AVAILABLE, STATUS_PROVISIONED
+)
+from models import ResourceInfo, ResourceFamilyRequest, ResourceFamilyResponse
 from logger import safe_log
 from typing import Tuple, List, Optional
 
+# Pool compartido para crear en paralelo los recursos sin dependencias entre sí;
+# dos tareas por familia para cada hilo del pool de lotes
+_provisioning_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="provisioning")
+
+# Pool acotado para los lotes; separado del anterior porque cada familia espera
+# a sus recursos en él y compartirlo podría agotar los hilos
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="provisioning-batch")
+
+# Campos fijos de cada tipo de recurso en la respuesta
+_INFO_TEMPLATES = {
+    "network": {"resource_type": "network", "status": STATUS_AVAILABLE},
+    "storage": {"resource_type": "storage", "status": STATUS_AVAILABLE},
+    "vm": {"resource_type": "vm", "status": STATUS_PROVISIONED}
+}
+
 class ResourceProvisioningService:
     """Servicio para aprovisionar familias de recursos usando Abstract Factory"""
     
+    __slots__ = ("factory_registry",)
+    
     def __init__(self):
         self.factory_registry = AbstractFactoryRegistry()
     
@@ -23,7 +44,8 @@ class ResourceProvisioningService:
         Aprovisiona una familia completa de recursos (VM + Red + Disco) para un proveedor específico.
         
         Garantiza consistencia: todos los recursos pertenecen al mismo proveedor.
-        Aplica el principio de atomicidad: si falla algún recurso, no se crean los demás.
+        Red y almacenamiento se crean en paralelo; si alguno falla, la VM no se crea.
+        Si falla la red, el almacenamiento ya creado se incluye en la respuesta.
         """
         
         provider_name = provider.lower()
@@ -35,88 +57,126 @@ class ResourceProvisioningService:
         
         try:
             # Obtener factory del proveedor específico
-            factory = self.factory_registry.get_factory(provider_name)
+            factory = self.factory_registry.find_factory(provider_name)
+            if factory is None:
+                return ResourceFamilyResponse.model_construct(
+                    success=False,
+                    error=f"Proveedor '{provider_name}' no soportado"
+                )
             
             # Crear instancias de recursos usando la factory
             network_resource = factory.create_network()
             storage_resource = factory.create_storage()
             vm_resource = factory.create_vm()
             
-            # Aprovisionar recursos en orden: Red -> Almacenamiento -> VM
+            # Red y almacenamiento no dependen entre sí: se crean en paralelo.
+            # La VM se crea después porque necesita ambos ids.
             resources_created = []
             
-            # 1. Crear recurso de red
-            success, network_id, error = network_resource.create_network(network_params)
+            network_future = _provisioning_executor.submit(
+                network_resource.create_network, network_params
+            )
+            storage_future = _provisioning_executor.submit(
+                storage_resource.create_storage, storage_params
+            )
+            
+            # 1. Verificar recurso de red
+            success, network_id, error = network_future.result()
             if not success:
-                return ResourceFamilyResponse(
+                # El almacenamiento pudo crearse en paralelo: se reporta para no perder su id
+                if not storage_future.cancel():
+                    storage_success, storage_id, _ = storage_future.result()
+                    if storage_success:
+                        resources_created.append(ResourceInfo.model_construct(
+                            resource_id=storage_id,
+                            details=storage_resource.get_storage_info(),
+                            **_INFO_TEMPLATES["storage"]
+                        ))
+                        safe_log("Almacenamiento creado antes de fallar la red", {"storage_id": storage_id})
+                return ResourceFamilyResponse.model_construct(
                     success=False, 
+                    resources=resources_created or None,
                     error=f"Error al crear recurso de red: {error}"
                 )
             
-            resources_created.append(ResourceInfo(
+            resources_created.append(ResourceInfo.model_construct(
                 resource_id=network_id,
-                resource_type="network",
-                status="disponible",
-                details=network_resource.get_network_info()
+                details=network_resource.get_network_info(),
+                **_INFO_TEMPLATES["network"]
             ))
             
-            safe_log(f"Recurso de red creado exitosamente", {"network_id": network_id})
+            safe_log("Recurso de red creado exitosamente", {"network_id": network_id})
             
-            # 2. Crear recurso de almacenamiento
-            success, storage_id, error = storage_resource.create_storage(storage_params)
+            # 2. Verificar recurso de almacenamiento
+            success, storage_id, error = storage_future.result()
             if not success:
-                return ResourceFamilyResponse(
+                return ResourceFamilyResponse.model_construct(
                     success=False, 
                     error=f"Error al crear recurso de almacenamiento: {error}"
                 )
             
-            resources_created.append(ResourceInfo(
+            resources_created.append(ResourceInfo.model_construct(
                 resource_id=storage_id,
-                resource_type="storage", 
-                status="disponible",
-                details=storage_resource.get_storage_info()
+                details=storage_resource.get_storage_info(),
+                **_INFO_TEMPLATES["storage"]
             ))
             
-            safe_log(f"Recurso de almacenamiento creado exitosamente", {"storage_id": storage_id})
+            safe_log("Recurso de almacenamiento creado exitosamente", {"storage_id": storage_id})
             
             # 3. Crear VM asociada a la red y almacenamiento
             success, vm_id, error = vm_resource.create_vm(vm_params, network_id, storage_id)
             if not success:
-                return ResourceFamilyResponse(
+                return ResourceFamilyResponse.model_construct(
                     success=False, 
                     error=f"Error al crear VM: {error}"
                 )
             
-            resources_created.append(ResourceInfo(
+            resources_created.append(ResourceInfo.model_construct(
                 resource_id=vm_id,
-                resource_type="vm",
-                status="aprovisionada",
-                details=vm_resource.get_vm_info()
+                details=vm_resource.get_vm_info(),
+                **_INFO_TEMPLATES["vm"]
             ))
             
-            safe_log(f"VM creada exitosamente", {"vm_id": vm_id})
+            safe_log("VM creada exitosamente", {"vm_id": vm_id})
             
             # Retornar respuesta exitosa con todos los recursos creados
-            return ResourceFamilyResponse(
+            return ResourceFamilyResponse.model_construct(
                 success=True,
                 provider=factory.get_provider_name(),
                 resources=resources_created
             )
             
-        except ValueError as e:
-            # Proveedor no soportado
-            return ResourceFamilyResponse(
-                success=False,
-                error=str(e)
-            )
         except Exception as e:
             # Error inesperado
-            safe_log(f"Error inesperado en aprovisionamiento", {"error": str(e)})
-            return ResourceFamilyResponse(
+            safe_log("Error inesperado en aprovisionamiento", {"error": str(e)})
+            return ResourceFamilyResponse.model_construct(
                 success=False,
                 error=f"Error interno del sistema: {str(e)}"
             )
     
+    def provision_many(self, families: List[ResourceFamilyRequest]) -> List[ResourceFamilyResponse]:
+        """
+        Aprovisiona varias familias de recursos de forma concurrente.
+        
+        Cada elemento es un ResourceFamilyRequest ya validado; sus parámetros se pasan sin copiarlos.
+        Los resultados conservan el orden de entrada; si una familia falla,
+        las demás continúan.
+        """
+        if not families:
+            return []
+        
+        safe_log("Iniciando aprovisionamiento en lote", {"total": len(families)})
+        
+        return list(_batch_executor.map(
+            lambda family: self.provision_resource_family(
+                family.provider,
+                family.vm_params,
+                family.network_params,
+                family.storage_params
+            ),
+            families
+        ))
+    
     def get_supported_providers(self) -> List[str]:
         """Obtener lista de proveedores soportados"""
         return self.factory_registry.get_supported_providers()
@@ -124,4 +184,4 @@ class ResourceProvisioningService:
     def register_new_provider(self, provider_name: str, factory_class: type):
         """Registrar un nuevo proveedor para extensibilidad futura"""
         self.factory_registry.register_factory(provider_name, factory_class)
-        safe_log(f"Nuevo proveedor registrado", {"provider": provider_name})
\ No newline at end of file
+        safe_log("Nuevo proveedor registrado", {"provider": provider_name})
\ No newline at end of file
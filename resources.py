@@ -9,6 +9,8 @@ from typing import Optional
 class NetworkResource(ABC):
     """Clase base abstracta para recursos de red"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create_network(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
         """Crear recurso de red. Retorna (éxito, id_recurso, error)"""
@@ -22,6 +24,8 @@ class NetworkResource(ABC):
 class StorageResource(ABC):
     """Clase base abstracta para recursos de almacenamiento"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create_storage(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
         """Crear recurso de almacenamiento. Retorna (éxito, id_recurso, error)"""
@@ -35,6 +39,8 @@ class StorageResource(ABC):
 class VMResource(ABC):
     """Clase base abstracta para recursos de máquinas virtuales"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create_vm(self, params: dict, network_id: str, storage_id: str) -> tuple[bool, Optional[str], Optional[str]]:
         """Crear VM asociada a red y almacenamiento. Retorna (éxito, id_vm, error)"""
@@ -45,77 +51,140 @@ class VMResource(ABC):
         """Obtener información de la VM creada"""
         pass
 
+# ============= ESTADOS DE RECURSOS =============
+
+STATUS_AVAILABLE = "disponible"
+STATUS_PROVISIONED = "aprovisionada"
+
+# ============= GENERACIÓN DE IDENTIFICADORES =============
+
+_CONTAINER_TYPES = (list, dict)
+
+def _hashable(value):
+    """Convierte listas y dicts (p. ej. reglas de firewall) en tuplas hashables"""
+    if isinstance(value, list):
+        return tuple([_hashable(item) for item in value])
+    if isinstance(value, dict):
+        return tuple([(key, _hashable(item)) for key, item in value.items()])
+    return value
+
+def _resource_id(prefix: str, params: dict, *extra: str) -> str:
+    """Genera un id simulado a partir de los parámetros, sin construir su representación en texto"""
+    values = tuple([
+        _hashable(value) if isinstance(value, _CONTAINER_TYPES) else value
+        for value in params.values()
+    ])
+    return f"{prefix}-{hash((tuple(params), values, extra)) % 1000}"
+
+# ============= PARÁMETROS REQUERIDOS POR RECURSO =============
+
+_AWS_NETWORK_REQUIRED = frozenset({"vpcId", "subnet", "securityGroup"})
+_AWS_STORAGE_REQUIRED = frozenset({"volumeType", "sizeGB", "encrypted"})
+_AWS_VM_REQUIRED = frozenset({"instance_type", "region", "ami"})
+_AZURE_NETWORK_REQUIRED = frozenset({"virtualNetwork", "subnetName", "networkSecurityGroup"})
+_AZURE_STORAGE_REQUIRED = frozenset({"diskSku", "sizeGB", "managedDisk"})
+_AZURE_VM_REQUIRED = frozenset({"size", "resource_group", "image"})
+_GCP_NETWORK_REQUIRED = frozenset({"networkName", "subnetworkName", "firewallTag"})
+_GCP_STORAGE_REQUIRED = frozenset({"diskType", "sizeGB", "autoDelete"})
+_GCP_VM_REQUIRED = frozenset({"machine_type", "zone", "project"})
+_ONPREMISE_NETWORK_REQUIRED = frozenset({"physicalInterface", "vlanId", "firewallPolicy"})
+_ONPREMISE_STORAGE_REQUIRED = frozenset({"storagePool", "sizeGB", "raidLevel"})
+_ONPREMISE_VM_REQUIRED = frozenset({"cpu", "ram"})
+
 # ============= IMPLEMENTACIONES AWS =============
 
 class AWSNetwork(NetworkResource):
+    __slots__ = ("network_id", "network_info")
+    _INFO_TEMPLATE = {
+        "vpc_id": None,
+        "subnet": None,
+        "security_group": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.network_id = None
         self.network_info = {}
         
     def create_network(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["vpcId", "subnet", "securityGroup"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de red AWS: {r}"
+        network_info = self._INFO_TEMPLATE.copy()
+        try:
+            network_info["vpc_id"] = params["vpcId"]
+            network_info["subnet"] = params["subnet"]
+            network_info["security_group"] = params["securityGroup"]
+        except KeyError:
+            missing = _AWS_NETWORK_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de red AWS: {', '.join(sorted(missing))}"
         
         # Simulación de creación
-        self.network_id = f"aws-net-{hash(str(params)) % 1000}"
-        self.network_info = {
-            "vpc_id": params["vpcId"],
-            "subnet": params["subnet"],
-            "security_group": params["securityGroup"],
-            "status": "disponible"
-        }
+        self.network_id = _resource_id("aws-net", params)
+        self.network_info = network_info
         return True, self.network_id, None
     
     def get_network_info(self) -> dict:
         return self.network_info
 
 class AWSStorage(StorageResource):
+    __slots__ = ("storage_id", "storage_info")
+    _INFO_TEMPLATE = {
+        "volume_type": None,
+        "size_gb": None,
+        "encrypted": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.storage_id = None
         self.storage_info = {}
         
     def create_storage(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["volumeType", "sizeGB", "encrypted"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de almacenamiento AWS: {r}"
+        storage_info = self._INFO_TEMPLATE.copy()
+        try:
+            storage_info["volume_type"] = params["volumeType"]
+            storage_info["size_gb"] = params["sizeGB"]
+            storage_info["encrypted"] = params["encrypted"]
+        except KeyError:
+            missing = _AWS_STORAGE_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de almacenamiento AWS: {', '.join(sorted(missing))}"
         
         # Simulación de creación
-        self.storage_id = f"aws-vol-{hash(str(params)) % 1000}"
-        self.storage_info = {
-            "volume_type": params["volumeType"],
-            "size_gb": params["sizeGB"],
-            "encrypted": params["encrypted"],
-            "status": "disponible"
-        }
+        self.storage_id = _resource_id("aws-vol", params)
+        self.storage_info = storage_info
         return True, self.storage_id, None
     
     def get_storage_info(self) -> dict:
         return self.storage_info
 
 class AWSVM(VMResource):
+    __slots__ = ("vm_id", "vm_info")
+    _INFO_TEMPLATE = {
+        "instance_type": None,
+        "region": None,
+        "ami": None,
+        "network_id": None,
+        "storage_id": None,
+        "status": STATUS_PROVISIONED
+    }
+    
     def __init__(self):
         self.vm_id = None
         self.vm_info = {}
         
     def create_vm(self, params: dict, network_id: str, storage_id: str) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["instance_type", "region", "ami"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de VM AWS: {r}"
+        vm_info = self._INFO_TEMPLATE.copy()
+        try:
+            vm_info["instance_type"] = params["instance_type"]
+            vm_info["region"] = params["region"]
+            vm_info["ami"] = params["ami"]
+            vm_info["network_id"] = network_id
+            vm_info["storage_id"] = storage_id
+        except KeyError:
+            missing = _AWS_VM_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de VM AWS: {', '.join(sorted(missing))}"
         
         # Simulación de creación
-        self.vm_id = f"aws-vm-{hash(str(params) + network_id + storage_id) % 1000}"
-        self.vm_info = {
-            "instance_type": params["instance_type"],
-            "region": params["region"],
-            "ami": params["ami"],
-            "network_id": network_id,
-            "storage_id": storage_id,
-            "status": "aprovisionada"
-        }
+        self.vm_id = _resource_id("aws-vm", params, network_id, storage_id)
+        self.vm_info = vm_info
         return True, self.vm_id, None
     
     def get_vm_info(self) -> dict:
@@ -124,71 +193,94 @@ class AWSVM(VMResource):
 # ============= IMPLEMENTACIONES AZURE =============
 
 class AzureNetwork(NetworkResource):
+    __slots__ = ("network_id", "network_info")
+    _INFO_TEMPLATE = {
+        "virtual_network": None,
+        "subnet_name": None,
+        "network_security_group": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.network_id = None
         self.network_info = {}
         
     def create_network(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["virtualNetwork", "subnetName", "networkSecurityGroup"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de red Azure: {r}"
+        network_info = self._INFO_TEMPLATE.copy()
+        try:
+            network_info["virtual_network"] = params["virtualNetwork"]
+            network_info["subnet_name"] = params["subnetName"]
+            network_info["network_security_group"] = params["networkSecurityGroup"]
+        except KeyError:
+            missing = _AZURE_NETWORK_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de red Azure: {', '.join(sorted(missing))}"
         
-        self.network_id = f"azure-net-{hash(str(params)) % 1000}"
-        self.network_info = {
-            "virtual_network": params["virtualNetwork"],
-            "subnet_name": params["subnetName"],
-            "network_security_group": params["networkSecurityGroup"],
-            "status": "disponible"
-        }
+        self.network_id = _resource_id("azure-net", params)
+        self.network_info = network_info
         return True, self.network_id, None
     
     def get_network_info(self) -> dict:
         return self.network_info
 
 class AzureStorage(StorageResource):
+    __slots__ = ("storage_id", "storage_info")
+    _INFO_TEMPLATE = {
+        "disk_sku": None,
+        "size_gb": None,
+        "managed_disk": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.storage_id = None
         self.storage_info = {}
         
     def create_storage(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["diskSku", "sizeGB", "managedDisk"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de almacenamiento Azure: {r}"
+        storage_info = self._INFO_TEMPLATE.copy()
+        try:
+            storage_info["disk_sku"] = params["diskSku"]
+            storage_info["size_gb"] = params["sizeGB"]
+            storage_info["managed_disk"] = params["managedDisk"]
+        except KeyError:
+            missing = _AZURE_STORAGE_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de almacenamiento Azure: {', '.join(sorted(missing))}"
         
-        self.storage_id = f"azure-disk-{hash(str(params)) % 1000}"
-        self.storage_info = {
-            "disk_sku": params["diskSku"],
-            "size_gb": params["sizeGB"],
-            "managed_disk": params["managedDisk"],
-            "status": "disponible"
-        }
+        self.storage_id = _resource_id("azure-disk", params)
+        self.storage_info = storage_info
         return True, self.storage_id, None
     
     def get_storage_info(self) -> dict:
         return self.storage_info
 
 class AzureVM(VMResource):
+    __slots__ = ("vm_id", "vm_info")
+    _INFO_TEMPLATE = {
+        "size": None,
+        "resource_group": None,
+        "image": None,
+        "network_id": None,
+        "storage_id": None,
+        "status": STATUS_PROVISIONED
+    }
+    
     def __init__(self):
         self.vm_id = None
         self.vm_info = {}
         
     def create_vm(self, params: dict, network_id: str, storage_id: str) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["size", "resource_group", "image"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de VM Azure: {r}"
+        vm_info = self._INFO_TEMPLATE.copy()
+        try:
+            vm_info["size"] = params["size"]
+            vm_info["resource_group"] = params["resource_group"]
+            vm_info["image"] = params["image"]
+            vm_info["network_id"] = network_id
+            vm_info["storage_id"] = storage_id
+        except KeyError:
+            missing = _AZURE_VM_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de VM Azure: {', '.join(sorted(missing))}"
         
-        self.vm_id = f"azure-vm-{hash(str(params) + network_id + storage_id) % 1000}"
-        self.vm_info = {
-            "size": params["size"],
-            "resource_group": params["resource_group"],
-            "image": params["image"],
-            "network_id": network_id,
-            "storage_id": storage_id,
-            "status": "aprovisionada"
-        }
+        self.vm_id = _resource_id("azure-vm", params, network_id, storage_id)
+        self.vm_info = vm_info
         return True, self.vm_id, None
     
     def get_vm_info(self) -> dict:
@@ -197,71 +289,94 @@ class AzureVM(VMResource):
 # ============= IMPLEMENTACIONES GCP =============
 
 class GCPNetwork(NetworkResource):
+    __slots__ = ("network_id", "network_info")
+    _INFO_TEMPLATE = {
+        "network_name": None,
+        "subnetwork_name": None,
+        "firewall_tag": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.network_id = None
         self.network_info = {}
         
     def create_network(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["networkName", "subnetworkName", "firewallTag"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de red GCP: {r}"
+        network_info = self._INFO_TEMPLATE.copy()
+        try:
+            network_info["network_name"] = params["networkName"]
+            network_info["subnetwork_name"] = params["subnetworkName"]
+            network_info["firewall_tag"] = params["firewallTag"]
+        except KeyError:
+            missing = _GCP_NETWORK_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de red GCP: {', '.join(sorted(missing))}"
         
-        self.network_id = f"gcp-net-{hash(str(params)) % 1000}"
-        self.network_info = {
-            "network_name": params["networkName"],
-            "subnetwork_name": params["subnetworkName"],
-            "firewall_tag": params["firewallTag"],
-            "status": "disponible"
-        }
+        self.network_id = _resource_id("gcp-net", params)
+        self.network_info = network_info
         return True, self.network_id, None
     
     def get_network_info(self) -> dict:
         return self.network_info
 
 class GCPStorage(StorageResource):
+    __slots__ = ("storage_id", "storage_info")
+    _INFO_TEMPLATE = {
+        "disk_type": None,
+        "size_gb": None,
+        "auto_delete": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.storage_id = None
         self.storage_info = {}
         
     def create_storage(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["diskType", "sizeGB", "autoDelete"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de almacenamiento GCP: {r}"
+        storage_info = self._INFO_TEMPLATE.copy()
+        try:
+            storage_info["disk_type"] = params["diskType"]
+            storage_info["size_gb"] = params["sizeGB"]
+            storage_info["auto_delete"] = params["autoDelete"]
+        except KeyError:
+            missing = _GCP_STORAGE_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de almacenamiento GCP: {', '.join(sorted(missing))}"
         
-        self.storage_id = f"gcp-disk-{hash(str(params)) % 1000}"
-        self.storage_info = {
-            "disk_type": params["diskType"],
-            "size_gb": params["sizeGB"],
-            "auto_delete": params["autoDelete"],
-            "status": "disponible"
-        }
+        self.storage_id = _resource_id("gcp-disk", params)
+        self.storage_info = storage_info
         return True, self.storage_id, None
     
     def get_storage_info(self) -> dict:
         return self.storage_info
 
 class GCPVM(VMResource):
+    __slots__ = ("vm_id", "vm_info")
+    _INFO_TEMPLATE = {
+        "machine_type": None,
+        "zone": None,
+        "project": None,
+        "network_id": None,
+        "storage_id": None,
+        "status": STATUS_PROVISIONED
+    }
+    
     def __init__(self):
         self.vm_id = None
         self.vm_info = {}
         
     def create_vm(self, params: dict, network_id: str, storage_id: str) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["machine_type", "zone", "project"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de VM GCP: {r}"
+        vm_info = self._INFO_TEMPLATE.copy()
+        try:
+            vm_info["machine_type"] = params["machine_type"]
+            vm_info["zone"] = params["zone"]
+            vm_info["project"] = params["project"]
+            vm_info["network_id"] = network_id
+            vm_info["storage_id"] = storage_id
+        except KeyError:
+            missing = _GCP_VM_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de VM GCP: {', '.join(sorted(missing))}"
         
-        self.vm_id = f"gcp-vm-{hash(str(params) + network_id + storage_id) % 1000}"
-        self.vm_info = {
-            "machine_type": params["machine_type"],
-            "zone": params["zone"],
-            "project": params["project"],
-            "network_id": network_id,
-            "storage_id": storage_id,
-            "status": "aprovisionada"
-        }
+        self.vm_id = _resource_id("gcp-vm", params, network_id, storage_id)
+        self.vm_info = vm_info
         return True, self.vm_id, None
     
     def get_vm_info(self) -> dict:
@@ -270,70 +385,92 @@ class GCPVM(VMResource):
 # ============= IMPLEMENTACIONES ON-PREMISE =============
 
 class OnPremiseNetwork(NetworkResource):
+    __slots__ = ("network_id", "network_info")
+    _INFO_TEMPLATE = {
+        "physical_interface": None,
+        "vlan_id": None,
+        "firewall_policy": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.network_id = None
         self.network_info = {}
         
     def create_network(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["physicalInterface", "vlanId", "firewallPolicy"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de red OnPremise: {r}"
+        network_info = self._INFO_TEMPLATE.copy()
+        try:
+            network_info["physical_interface"] = params["physicalInterface"]
+            network_info["vlan_id"] = params["vlanId"]
+            network_info["firewall_policy"] = params["firewallPolicy"]
+        except KeyError:
+            missing = _ONPREMISE_NETWORK_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de red OnPremise: {', '.join(sorted(missing))}"
         
-        self.network_id = f"onprem-net-{hash(str(params)) % 1000}"
-        self.network_info = {
-            "physical_interface": params["physicalInterface"],
-            "vlan_id": params["vlanId"],
-            "firewall_policy": params["firewallPolicy"],
-            "status": "disponible"
-        }
+        self.network_id = _resource_id("onprem-net", params)
+        self.network_info = network_info
         return True, self.network_id, None
     
     def get_network_info(self) -> dict:
         return self.network_info
 
 class OnPremiseStorage(StorageResource):
+    __slots__ = ("storage_id", "storage_info")
+    _INFO_TEMPLATE = {
+        "storage_pool": None,
+        "size_gb": None,
+        "raid_level": None,
+        "status": STATUS_AVAILABLE
+    }
+    
     def __init__(self):
         self.storage_id = None
         self.storage_info = {}
         
     def create_storage(self, params: dict) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["storagePool", "sizeGB", "raidLevel"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de almacenamiento OnPremise: {r}"
+        storage_info = self._INFO_TEMPLATE.copy()
+        try:
+            storage_info["storage_pool"] = params["storagePool"]
+            storage_info["size_gb"] = params["sizeGB"]
+            storage_info["raid_level"] = params["raidLevel"]
+        except KeyError:
+            missing = _ONPREMISE_STORAGE_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de almacenamiento OnPremise: {', '.join(sorted(missing))}"
         
-        self.storage_id = f"onprem-stor-{hash(str(params)) % 1000}"
-        self.storage_info = {
-            "storage_pool": params["storagePool"],
-            "size_gb": params["sizeGB"],
-            "raid_level": params["raidLevel"],
-            "status": "disponible"
-        }
+        self.storage_id = _resource_id("onprem-stor", params)
+        self.storage_info = storage_info
         return True, self.storage_id, None
     
     def get_storage_info(self) -> dict:
         return self.storage_info
 
 class OnPremiseVM(VMResource):
+    __slots__ = ("vm_id", "vm_info")
+    _INFO_TEMPLATE = {
+        "cpu": None,
+        "ram": None,
+        "network_id": None,
+        "storage_id": None,
+        "status": STATUS_PROVISIONED
+    }
+    
     def __init__(self):
         self.vm_id = None
         self.vm_info = {}
         
     def create_vm(self, params: dict, network_id: str, storage_id: str) -> tuple[bool, Optional[str], Optional[str]]:
-        required = ["cpu", "ram"]
-        for r in required:
-            if r not in params:
-                return False, None, f"Falta parámetro de VM OnPremise: {r}"
+        vm_info = self._INFO_TEMPLATE.copy()
+        try:
+            vm_info["cpu"] = params["cpu"]
+            vm_info["ram"] = params["ram"]
+            vm_info["network_id"] = network_id
+            vm_info["storage_id"] = storage_id
+        except KeyError:
+            missing = _ONPREMISE_VM_REQUIRED - params.keys()
+            return False, None, f"Falta parámetro de VM OnPremise: {', '.join(sorted(missing))}"
         
-        self.vm_id = f"onprem-vm-{hash(str(params) + network_id + storage_id) % 1000}"
-        self.vm_info = {
-            "cpu": params["cpu"],
-            "ram": params["ram"],
-            "network_id": network_id,
-            "storage_id": storage_id,
-            "status": "aprovisionada"
-        }
+        self.vm_id = _resource_id("onprem-vm", params, network_id, storage_id)
+        self.vm_info = vm_info
         return True, self.vm_id, None
     
     def get_vm_info(self) -> dict:
@@ -4,38 +4,69 @@ Valida el aprovisionamiento consistente de VM + Red + Disco por proveedor
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from api import app
-
-client = TestClient(app)
+from abstract_factory import AbstractFactoryRegistry, AWSResourceFactory
+from resource_provisioner import ResourceProvisioningService
 
 # ============= TESTS PARA FAMILIAS DE RECURSOS (ABSTRACT FACTORY) =============
 
-def test_provision_aws_family_success():
-    """Test aprovisionamiento exitoso de familia AWS completa"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-12345"
-        },
-        "network_params": {
-            "vpcId": "vpc-123",
-            "subnet": "subnet-456",
-            "securityGroup": "sg-789"
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
-        }
-    })
+# Payloads compartidos: se construyen una sola vez por módulo
+AWS_FAMILY_REQUEST = {
+    "provider": "aws",
+    "vm_params": {"instance_type": "t2.micro", "region": "us-east-1", "ami": "ami-12345"},
+    "network_params": {"vpcId": "vpc-123", "subnet": "subnet-456", "securityGroup": "sg-789"},
+    "storage_params": {"volumeType": "gp2", "sizeGB": 20, "encrypted": True}
+}
+
+AZURE_FAMILY_REQUEST = {
+    "provider": "azure",
+    "vm_params": {"size": "Standard_B1s", "resource_group": "rg-test", "image": "ubuntu-20.04"},
+    "network_params": {"virtualNetwork": "vnet-test", "subnetName": "subnet-test", "networkSecurityGroup": "nsg-test"},
+    "storage_params": {"diskSku": "Standard_LRS", "sizeGB": 30, "managedDisk": True}
+}
+
+GCP_FAMILY_REQUEST = {
+    "provider": "gcp",
+    "vm_params": {"machine_type": "n1-standard-1", "zone": "us-central1-a", "project": "my-project-123"},
+    "network_params": {"networkName": "default", "subnetworkName": "default-subnet", "firewallTag": "allow-http"},
+    "storage_params": {"diskType": "pd-standard", "sizeGB": 50, "autoDelete": True}
+}
+
+ONPREMISE_FAMILY_REQUEST = {
+    "provider": "onpremise",
+    "vm_params": {"cpu": 4, "ram": 8, "hypervisor": "vmware"},
+    "network_params": {"physicalInterface": "eth0", "vlanId": 100, "firewallPolicy": "allow-all"},
+    "storage_params": {"storagePool": "pool-ssd", "sizeGB": 100, "raidLevel": "raid1"}
+}
+
+PROVIDER_FAMILY_CASES = [
+    (AWS_FAMILY_REQUEST, "AWS"),
+    (AZURE_FAMILY_REQUEST, "Azure"),
+    (GCP_FAMILY_REQUEST, "Google Cloud"),
+    (ONPREMISE_FAMILY_REQUEST, "On-Premise"),
+]
+
+@pytest.fixture(scope="module")
+def provision_family(client):
+    """Aprovisiona cada payload de familia una sola vez por módulo y reutiliza la respuesta"""
+    responses = {}
+
+    def _provision(payload):
+        key = payload["provider"]
+        if key not in responses:
+            responses[key] = client.post("/provision_resource_family", json=payload)
+        return responses[key]
+
+    return _provision
+
+@pytest.mark.parametrize("payload,label", PROVIDER_FAMILY_CASES)
+def test_provision_family_success(provision_family, payload, label):
+    """Test aprovisionamiento exitoso de la familia completa de cada proveedor"""
+    response = provision_family(payload)
     
     data = response.json()
     assert response.status_code == 200
     assert data["success"] is True
-    assert data["provider"] == "AWS"
+    assert data["provider"] == label
     assert len(data["resources"]) == 3
     
     # Verificar que se crearon los 3 tipos de recursos
@@ -44,154 +75,56 @@ def test_provision_aws_family_success():
     assert "storage" in resource_types
     assert "vm" in resource_types
 
-def test_provision_azure_family_success():
-    """Test aprovisionamiento exitoso de familia Azure completa"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "azure",
-        "vm_params": {
-            "size": "Standard_B1s",
-            "resource_group": "rg-test",
-            "image": "ubuntu-20.04"
-        },
-        "network_params": {
-            "virtualNetwork": "vnet-test",
-            "subnetName": "subnet-test",
-            "networkSecurityGroup": "nsg-test"
-        },
-        "storage_params": {
-            "diskSku": "Standard_LRS",
-            "sizeGB": 30,
-            "managedDisk": True
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "Azure"
-    assert len(data["resources"]) == 3
+# Los casos de error solo validan la lógica del servicio; se llaman sin pasar por HTTP.
+# test_resource_families.py cubre estos mismos errores a través del endpoint.
 
-def test_provision_gcp_family_success():
-    """Test aprovisionamiento exitoso de familia GCP completa"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "gcp",
-        "vm_params": {
-            "machine_type": "n1-standard-1",
-            "zone": "us-central1-a",
-            "project": "my-project-123"
-        },
-        "network_params": {
-            "networkName": "default",
-            "subnetworkName": "default-subnet",
-            "firewallTag": "allow-http"
-        },
-        "storage_params": {
-            "diskType": "pd-standard",
-            "sizeGB": 50,
-            "autoDelete": True
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "Google Cloud"
-    assert len(data["resources"]) == 3
+@pytest.fixture(scope="module")
+def provisioning_service():
+    return ResourceProvisioningService()
 
-def test_provision_onpremise_family_success():
-    """Test aprovisionamiento exitoso de familia OnPremise completa"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "onpremise",
-        "vm_params": {
-            "cpu": 4,
-            "ram": 8,
-            "hypervisor": "vmware"
-        },
-        "network_params": {
-            "physicalInterface": "eth0",
-            "vlanId": 100,
-            "firewallPolicy": "allow-all"
-        },
-        "storage_params": {
-            "storagePool": "pool-ssd",
-            "sizeGB": 100,
-            "raidLevel": "raid1"
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "On-Premise"
-    assert len(data["resources"]) == 3
-
-def test_provision_family_missing_network_params():
+def test_provision_family_missing_network_params(provisioning_service):
     """Test error cuando faltan parámetros de red"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-12345"
-        },
+    result = provisioning_service.provision_resource_family(**{
+        **AWS_FAMILY_REQUEST,
         "network_params": {
             "vpcId": "vpc-123"
             # Faltan subnet y securityGroup
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
         }
     })
     
-    data = response.json()
-    assert data["success"] is False
-    assert "Falta parámetro de red AWS" in data["error"]
+    assert result.success is False
+    assert "Falta parámetro de red AWS" in result.error
 
-def test_provision_family_missing_storage_params():
+def test_provision_family_missing_storage_params(provisioning_service):
     """Test error cuando faltan parámetros de almacenamiento"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "azure",
-        "vm_params": {
-            "size": "Standard_B1s",
-            "resource_group": "rg-test",
-            "image": "ubuntu-20.04"
-        },
-        "network_params": {
-            "virtualNetwork": "vnet-test",
-            "subnetName": "subnet-test",
-            "networkSecurityGroup": "nsg-test"
-        },
+    result = provisioning_service.provision_resource_family(**{
+        **AZURE_FAMILY_REQUEST,
         "storage_params": {
             "diskSku": "Standard_LRS"
             # Faltan sizeGB y managedDisk
         }
     })
     
-    data = response.json()
-    assert data["success"] is False
-    assert "Falta parámetro de almacenamiento Azure" in data["error"]
+    assert result.success is False
+    assert "Falta parámetro de almacenamiento Azure" in result.error
 
-def test_provision_family_unsupported_provider():
+def test_provision_family_unsupported_provider(provisioning_service):
     """Test error con proveedor no soportado"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "oracle",
-        "vm_params": {"instance_type": "test"},
-        "network_params": {"network": "test"},
-        "storage_params": {"storage": "test"}
-    })
+    result = provisioning_service.provision_resource_family(
+        provider="oracle",
+        vm_params={"instance_type": "test"},
+        network_params={"network": "test"},
+        storage_params={"storage": "test"}
+    )
     
-    data = response.json()
-    assert data["success"] is False
-    assert "no soportado" in data["error"]
+    assert result.success is False
+    assert "no soportado" in result.error
 
-def test_get_supported_providers():
+def test_get_supported_providers(cached_get):
     """Test endpoint de proveedores soportados"""
-    response = client.get("/supported_providers")
-    data = response.json()
+    status_code, data = cached_get("/supported_providers")
     
-    assert response.status_code == 200
+    assert status_code == 200
     assert "providers" in data
     assert "aws" in data["providers"]
     assert "azure" in data["providers"]
@@ -200,30 +133,38 @@ def test_get_supported_providers():
 
 # ============= TESTS DE CONSISTENCIA =============
 
-def test_resource_family_consistency():
+def test_resource_family_consistency(provision_family):
     """Test que verifica que todos los recursos pertenecen al mismo proveedor"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-12345"
-        },
-        "network_params": {
-            "vpcId": "vpc-123",
-            "subnet": "subnet-456",
-            "securityGroup": "sg-789"
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
-        }
-    })
+    response = provision_family(AWS_FAMILY_REQUEST)
     
     data = response.json()
     assert data["success"] is True
     
     # Verificar que todos los resource_ids contienen el prefijo del proveedor
     for resource in data["resources"]:
-        assert "aws" in resource["resource_id"].lower()
\ No newline at end of file
+        assert "aws" in resource["resource_id"].lower()
+
+# ============= TESTS DEL REGISTRO DE FACTORIES =============
+
+def test_factory_instances_are_reused():
+    """Test que el registro reutiliza la misma instancia de factory por proveedor"""
+    first = AbstractFactoryRegistry.get_factory("aws")
+    second = AbstractFactoryRegistry.get_factory("AWS")
+    assert first is second
+
+def test_registered_factory_replaces_cached_one(provisioning_service):
+    """Test que registrar una factory en el registro se refleja en servicios ya usados"""
+    class CustomAWSFactory(AWSResourceFactory):
+        def get_provider_name(self) -> str:
+            return "AWS-Custom"
+    
+    assert provisioning_service.provision_resource_family(**AWS_FAMILY_REQUEST).provider == "AWS"
+    
+    AbstractFactoryRegistry.register_factory("aws", CustomAWSFactory)
+    try:
+        result = provisioning_service.provision_resource_family(**AWS_FAMILY_REQUEST)
+        assert result.provider == "AWS-Custom"
+    finally:
+        AbstractFactoryRegistry.unregister_factory("aws")
+    
+    assert provisioning_service.provision_resource_family(**AWS_FAMILY_REQUEST).provider == "AWS"
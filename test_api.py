@@ -1,27 +1,26 @@
 import pytest
-from fastapi.testclient import TestClient
-from api import app
-
-client = TestClient(app)
 
 # Casos de prueba para cada proveedor
 
-def test_provision_aws_exito():
+PROVIDER_SUCCESS_CASES = [
+    ("aws", {"instance_type": "t2.micro", "region": "us-east-1", "vpc": "vpc-123", "ami": "ami-456"}, "aws-vm-123"),
+    ("azure", {"size": "Standard_B1s", "resource_group": "rg-1", "image": "img-2", "vnet": "vnet-3"}, "azure-vm-456"),
+    ("gcp", {"machine_type": "n1-standard-1", "zone": "us-central1-a", "disk": "disk-1", "project": "proj-2"}, "gcp-vm-789"),
+    ("onpremise", {"cpu": 4, "ram": 16, "disk": 100, "network": "eth0"}, "onprem-vm-001"),
+]
+
+@pytest.mark.parametrize("provider,params,vm_id", PROVIDER_SUCCESS_CASES)
+def test_provision_exito(client, provider, params, vm_id):
     response = client.post("/provision_vm", json={
-        "provider": "aws",
-        "params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "vpc": "vpc-123",
-            "ami": "ami-456"
-        }
+        "provider": provider,
+        "params": params
     })
     data = response.json()
     assert data["success"] is True
-    assert data["vm_id"] == "aws-vm-123"
+    assert data["vm_id"] == vm_id
     assert data["error"] is None
 
-def test_provision_aws_error():
+def test_provision_aws_error(client):
     response = client.post("/provision_vm", json={
         "provider": "aws",
         "params": {
@@ -36,57 +35,26 @@ def test_provision_aws_error():
     assert data["vm_id"] is None
     assert "Falta parámetro AWS" in data["error"]
 
-def test_provision_azure_exito():
+def test_provision_proveedor_no_soportado(client):
     response = client.post("/provision_vm", json={
-        "provider": "azure",
-        "params": {
-            "size": "Standard_B1s",
-            "resource_group": "rg-1",
-            "image": "img-2",
-            "vnet": "vnet-3"
-        }
-    })
-    data = response.json()
-    assert data["success"] is True
-    assert data["vm_id"] == "azure-vm-456"
-    assert data["error"] is None
-
-def test_provision_gcp_exito():
-    response = client.post("/provision_vm", json={
-        "provider": "gcp",
-        "params": {
-            "machine_type": "n1-standard-1",
-            "zone": "us-central1-a",
-            "disk": "disk-1",
-            "project": "proj-2"
-        }
+        "provider": "oracle",
+        "params": {}
     })
     data = response.json()
-    assert data["success"] is True
-    assert data["vm_id"] == "gcp-vm-789"
-    assert data["error"] is None
+    assert data["success"] is False
+    assert data["vm_id"] is None
+    assert "Proveedor" in data["error"]
 
-def test_provision_onpremise_exito():
+def test_provision_proveedor_mayusculas(client):
     response = client.post("/provision_vm", json={
-        "provider": "onpremise",
+        "provider": "AWS",
         "params": {
-            "cpu": 4,
-            "ram": 16,
-            "disk": 100,
-            "network": "eth0"
+            "instance_type": "t2.micro",
+            "region": "us-east-1",
+            "vpc": "vpc-123",
+            "ami": "ami-456"
         }
     })
     data = response.json()
     assert data["success"] is True
-    assert data["vm_id"] == "onprem-vm-001"
-    assert data["error"] is None
-
-def test_provision_proveedor_no_soportado():
-    response = client.post("/provision_vm", json={
-        "provider": "oracle",
-        "params": {}
-    })
-    data = response.json()
-    assert data["success"] is False
-    assert data["vm_id"] is None
-    assert "Proveedor" in data["error"]
+    assert data["vm_id"] == "aws-vm-123"
@@ -4,15 +4,12 @@ Valida la construcción de diferentes tipos de VM usando Director + Builder.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from api import app
 from models_extended import VMType, Provider
-
-client = TestClient(app)
+from vm_construction_service import VMConstructionService
 
 # ============= TESTS PARA BUILDER PATTERN =============
 
-def test_build_standard_aws_vm():
+def test_build_standard_aws_vm(client):
     """Test construcción de VM Standard en AWS"""
     response = client.post("/build_vm", json={
         "vm_type": "standard",
@@ -31,7 +28,7 @@ def test_build_standard_aws_vm():
     resource_ids = [r["resource_id"] for r in data["created_resources"]]
     assert all("aws" in rid.lower() for rid in resource_ids)
 
-def test_build_memory_optimized_azure_vm():
+def test_build_memory_optimized_azure_vm(client):
     """Test construcción de VM Memory Optimized en Azure"""
     response = client.post("/build_vm", json={
         "vm_type": "memory_optimized",
@@ -50,7 +47,7 @@ def test_build_memory_optimized_azure_vm():
     assert vm_config["memory_optimization"] is True
     assert vm_config["memory_gb"] >= 16  # Memory optimized tiene más memoria
 
-def test_build_compute_optimized_gcp_vm():
+def test_build_compute_optimized_gcp_vm(client):
     """Test construcción de VM Compute Optimized en GCP"""
     response = client.post("/build_vm", json={
         "vm_type": "compute_optimized",
@@ -67,7 +64,7 @@ def test_build_compute_optimized_gcp_vm():
     vm_config = data["vm_specification"]["vm_config"]
     assert vm_config["disk_optimization"] is True
 
-def test_build_onpremise_vm_with_custom_config():
+def test_build_onpremise_vm_with_custom_config(client):
     """Test construcción de VM OnPremise con configuraciones personalizadas"""
     response = client.post("/build_vm", json={
         "vm_type": "standard",
@@ -95,12 +92,62 @@ def test_build_onpremise_vm_with_custom_config():
     storage_config = data["vm_specification"]["storage_config"]
     assert storage_config["size_gb"] == 200
 
-def test_get_aws_configurations():
-    """Test obtener configuraciones disponibles para AWS"""
-    response = client.get("/vm_configurations/aws")
+def test_build_respects_explicit_false_storage_flags(client):
+    """Test que un False explícito en storage no se reemplaza por el valor por defecto"""
+    response = client.post("/build_vm", json={
+        "vm_type": "standard",
+        "provider": "aws",
+        "region": "us-east-1",
+        "custom_storage_config": {
+            "encrypted": False
+        }
+    })
     
     data = response.json()
     assert response.status_code == 200
+    assert data["success"] is True
+    
+    storage = next(r for r in data["created_resources"] if r["resource_type"] == "storage")
+    assert storage["details"]["encrypted"] is False
+
+def test_build_vm_batch(client):
+    """Test construcción en lote: conserva el orden y aísla los errores"""
+    response = client.post("/build_vm_batch", json={
+        "requests": [
+            {"vm_type": "standard", "provider": "aws", "region": "us-east-1"},
+            {
+                "vm_type": "standard",
+                "provider": "gcp",
+                "region": "us-central1",
+                "custom_storage_config": {"region": "europe-west1"}
+            },
+            {"vm_type": "compute_optimized", "provider": "azure", "region": "eastus"}
+        ]
+    })
+    
+    data = response.json()
+    assert response.status_code == 200
+    assert [r["success"] for r in data["results"]] == [True, False, True]
+    assert data["results"][0]["vm_specification"]["provider"] == "aws"
+    assert data["results"][1]["error"]
+    assert data["results"][2]["vm_specification"]["provider"] == "azure"
+
+def test_built_specifications_are_independent_copies():
+    """Test: Modificar las reglas de una VM construida no altera las siguientes"""
+    service = VMConstructionService()
+    first = service.build_vm(VMType.STANDARD, Provider.AWS, "us-east-1")
+    network = next(r for r in first.created_resources if r["resource_type"] == "network")
+    original_rules = list(network["details"]["firewallRules"])
+    network["details"]["firewallRules"].append("LEAK")
+    
+    second = service.build_vm(VMType.STANDARD, Provider.AWS, "us-east-1")
+    assert second.vm_specification.network_config.firewall_rules == original_rules
+    validation = service.validate_configuration(Provider.AWS, VMType.STANDARD, "us-east-1")
+    assert validation["specification"]["network_config"]["firewall_rules"] == original_rules
+
+def test_get_aws_configurations(all_configs):
+    """Test obtener configuraciones disponibles para AWS"""
+    data = all_configs["aws"]
     assert data["provider"] == "aws"
     assert "vm_types" in data
     assert "standard" in data["vm_types"]
@@ -112,17 +159,21 @@ def test_get_aws_configurations():
         assert "flavors" in data["vm_types"][vm_type]
         assert "default_flavor" in data["vm_types"][vm_type]
 
-def test_get_azure_configurations():
+def test_get_azure_configurations(all_configs):
     """Test obtener configuraciones disponibles para Azure"""
-    response = client.get("/vm_configurations/azure")
-    
-    data = response.json()
-    assert response.status_code == 200
+    data = all_configs["azure"]
     assert data["provider"] == "azure"
     assert "supported_regions" in data
     assert "eastus" in data["supported_regions"]
 
-def test_validate_valid_configuration():
+def test_provider_configurations_match_batch(cached_get, all_configs):
+    """Test que el endpoint por proveedor coincide con el endpoint agrupado"""
+    status_code, data = cached_get("/vm_configurations/aws")
+    
+    assert status_code == 200
+    assert data == all_configs["aws"]
+
+def test_validate_valid_configuration(client):
     """Test validar configuración válida"""
     response = client.post("/validate_vm_config", params={
         "provider": "aws",
@@ -137,7 +188,7 @@ def test_validate_valid_configuration():
     assert "specification" in data
     assert "estimated_cost" in data
 
-def test_validate_invalid_configuration():
+def test_validate_invalid_configuration(client):
     """Test validar configuración inválida"""
     response = client.post("/validate_vm_config", params={
         "provider": "aws",
@@ -148,7 +199,7 @@ def test_validate_invalid_configuration():
     data = response.json()
     assert response.status_code == 422  # Validation error por enum inválido
 
-def test_build_vm_unsupported_provider():
+def test_build_vm_unsupported_provider(client):
     """Test error con proveedor no soportado en Builder"""
     # Nota: Este test usará un proveedor válido del enum pero que falle internamente
     response = client.post("/build_vm", json={
@@ -162,18 +213,18 @@ def test_build_vm_unsupported_provider():
     assert response.status_code == 200
     # Puede ser exitoso o fallar dependiendo de la validación interna
 
-def test_vm_types_consistency():
+def test_vm_types_consistency(cached_get):
     """Test consistencia de tipos de VM entre Director y Builder"""
     # Verificar que los tipos soportados son consistentes
-    response = client.get("/supported_providers")
-    data = response.json()
+    status_code, data = cached_get("/supported_providers")
     
+    assert status_code == 200
     assert "vm_types" in data
     expected_types = ["standard", "memory_optimized", "compute_optimized"]
     for vm_type in expected_types:
         assert vm_type in data["vm_types"]
 
-def test_cost_estimation_in_validation():
+def test_cost_estimation_in_validation(client):
     """Test estimación de costos en validación"""
     response = client.post("/validate_vm_config", params={
         "provider": "aws",
@@ -189,7 +240,7 @@ def test_cost_estimation_in_validation():
         assert "estimated_monthly" in cost_info
         assert cost_info["total_hourly"] > 0
 
-def test_region_consistency_validation():
+def test_region_consistency_validation(client):
     """Test validación de consistencia de regiones"""
     response = client.post("/build_vm", json={
         "vm_type": "standard",
@@ -209,58 +260,38 @@ def test_region_consistency_validation():
 
 # ============= TESTS DE CONFIGURACIONES ESPECÍFICAS POR PROVEEDOR =============
 
-def test_aws_instance_types_assignment():
-    """Test que AWS asigne tipos de instancia correctamente según VM type"""
-    response = client.post("/build_vm", json={
-        "vm_type": "compute_optimized",
-        "provider": "aws",
-        "region": "us-east-1"
-    })
-    
-    data = response.json()
-    if data["success"]:
-        vm_config = data["vm_specification"]["vm_config"]
-        # Compute optimized debería usar instancias C5
-        assert vm_config.get("instance_type", "").startswith("c5")
+def _assert_aws_compute_optimized(vm_config):
+    # Compute optimized debería usar instancias C5
+    assert vm_config.get("instance_type", "").startswith("c5")
 
-def test_azure_vm_sizes_assignment():
-    """Test que Azure asigne tamaños correctamente según VM type"""
-    response = client.post("/build_vm", json={
-        "vm_type": "memory_optimized",
-        "provider": "azure", 
-        "region": "eastus"
-    })
-    
-    data = response.json()
-    if data["success"]:
-        vm_config = data["vm_specification"]["vm_config"]
-        # Memory optimized debería usar series E
-        assert "E" in vm_config.get("size", "")
+def _assert_azure_memory_optimized(vm_config):
+    # Memory optimized debería usar series E
+    assert "E" in vm_config.get("size", "")
 
-def test_gcp_machine_types_assignment():
-    """Test que GCP asigne machine types correctamente"""
-    response = client.post("/build_vm", json={
-        "vm_type": "standard",
-        "provider": "gcp",
-        "region": "us-central1"
-    })
-    
-    data = response.json()
-    if data["success"]:
-        vm_config = data["vm_specification"]["vm_config"]
-        # Standard debería usar e2-standard
-        assert vm_config.get("machine_type", "").startswith("e2-standard")
+def _assert_gcp_standard(vm_config):
+    # Standard debería usar e2-standard
+    assert vm_config.get("machine_type", "").startswith("e2-standard")
+
+def _assert_onpremise_standard(vm_config):
+    assert vm_config["vcpus"] >= 2
+    assert vm_config["memory_gb"] >= 4
 
-def test_onpremise_flavor_assignment():
-    """Test que OnPremise asigne flavors correctamente"""
+PROVIDER_ASSIGNMENT_CASES = [
+    ("compute_optimized", "aws", "us-east-1", _assert_aws_compute_optimized),
+    ("memory_optimized", "azure", "eastus", _assert_azure_memory_optimized),
+    ("standard", "gcp", "us-central1", _assert_gcp_standard),
+    ("standard", "onpremise", "datacenter-1", _assert_onpremise_standard),
+]
+
+@pytest.mark.parametrize("vm_type,provider,region,check", PROVIDER_ASSIGNMENT_CASES)
+def test_provider_config_assignment(client, vm_type, provider, region, check):
+    """Test que cada proveedor asigne su configuración específica según VM type"""
     response = client.post("/build_vm", json={
-        "vm_type": "standard",
-        "provider": "onpremise",
-        "region": "datacenter-1"
+        "vm_type": vm_type,
+        "provider": provider,
+        "region": region
     })
     
     data = response.json()
     if data["success"]:
-        vm_config = data["vm_specification"]["vm_config"]
-        assert vm_config["vcpus"] >= 2
-        assert vm_config["memory_gb"] >= 4
\ No newline at end of file
+        check(data["vm_specification"]["vm_config"])
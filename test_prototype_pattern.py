@@ -12,32 +12,74 @@ from models_extended import (
 )
 
 
+@pytest.fixture(scope="module")
+def aws_standard_spec():
+    """Especificación AWS estándar compartida; los tests solo la leen o la clonan"""
+    return VMSpecification(
+        vm_type=VMType.STANDARD,
+        provider=Provider.AWS,
+        region="us-east-1",
+        vm_config=VirtualMachineConfig(
+            provider=Provider.AWS,
+            vcpus=2,
+            memory_gb=4,
+            instance_type="t3.medium"
+        ),
+        network_config=NetworkConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            firewall_rules=["SSH"]
+        ),
+        storage_config=StorageConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            size_gb=20
+        )
+    )
+
+
+def _make_spec(vm_type, provider, region, size_gb, vm, network=None, storage=None):
+    """Construye una VMSpecification validada; vm, network y storage agregan campos de cada config"""
+    return VMSpecification(
+        vm_type=vm_type,
+        provider=provider,
+        region=region,
+        vm_config=VirtualMachineConfig(provider=provider, **vm),
+        network_config=NetworkConfig(provider=provider, region=region, **(network or {})),
+        storage_config=StorageConfig(provider=provider, region=region, size_gb=size_gb, **(storage or {}))
+    )
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Registry compartido por el módulo; los templates por defecto se crean una sola vez"""
+    return PrototypeRegistry()
+
+
+@pytest.fixture
+def isolated_registry():
+    """Registry propio del test, para tests que lo modifican (templates, categorías y contadores)"""
+    return PrototypeRegistry()
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Servicio de prototipos compartido por el módulo"""
+    return VMPrototypeService()
+
+
+@pytest.fixture
+def isolated_service():
+    """Servicio propio del test, para tests que modifican su registry o sus cachés"""
+    return VMPrototypeService()
+
+
 class TestVMPrototype:
     """Tests para la implementación del prototipo de VM"""
     
-    def test_prototype_creation(self):
+    def test_prototype_creation(self, aws_standard_spec):
         """Test: Crear un prototipo básico"""
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=2,
-                memory_gb=4,
-                instance_type="t3.medium"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["SSH"]
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=20
-            )
-        )
+        vm_spec = aws_standard_spec
         
         prototype = ConcreteVMPrototype(
             template_name="test-template",
@@ -50,29 +92,9 @@ class TestVMPrototype:
         assert prototype.vm_specification.provider == Provider.AWS
         assert prototype.creation_count == 0
     
-    def test_prototype_clone(self):
+    def test_prototype_clone(self, aws_standard_spec):
         """Test: Clonar un prototipo"""
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=2,
-                memory_gb=4,
-                instance_type="t3.medium"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["SSH"]
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=20
-            )
-        )
+        vm_spec = aws_standard_spec
         
         original = ConcreteVMPrototype(
             template_name="original",
@@ -83,8 +105,8 @@ class TestVMPrototype:
         cloned = original.clone()
         
         # Verificar que son instancias diferentes
-        assert id(original) != id(cloned)
-        assert id(original.vm_specification) != id(cloned.vm_specification)
+        assert original is not cloned
+        assert original.vm_specification is not cloned.vm_specification
         
         # Verificar que el contenido es igual
         assert original.template_name == cloned.template_name
@@ -94,29 +116,9 @@ class TestVMPrototype:
         assert original.creation_count == 1
         assert cloned.creation_count == 0
     
-    def test_prototype_customize(self):
+    def test_prototype_customize(self, aws_standard_spec):
         """Test: Personalizar un prototipo clonado"""
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=2,
-                memory_gb=4,
-                instance_type="t3.medium"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["SSH"]
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=20
-            )
-        )
+        vm_spec = aws_standard_spec
         
         prototype = ConcreteVMPrototype(
             template_name="customizable",
@@ -204,10 +206,8 @@ class TestVMPrototype:
 class TestPrototypeRegistry:
     """Tests para el registro de prototipos"""
     
-    def test_registry_initialization(self):
+    def test_registry_initialization(self, registry):
         """Test: Inicialización del registry con templates predeterminados"""
-        registry = PrototypeRegistry()
-        
         # Verificar que se crearon templates predeterminados
         templates = registry.list_templates()
         assert templates["total"] > 0
@@ -217,9 +217,9 @@ class TestPrototypeRegistry:
         assert registry.get_prototype("database-optimized") is not None
         assert registry.get_prototype("analytics-compute") is not None
     
-    def test_register_new_template(self):
+    def test_register_new_template(self, isolated_registry):
         """Test: Registrar un nuevo template"""
-        registry = PrototypeRegistry()
+        registry = isolated_registry
         
         vm_spec = VMSpecification(
             vm_type=VMType.COMPUTE_OPTIMIZED,
@@ -259,9 +259,9 @@ class TestPrototypeRegistry:
         duplicate_success = registry.register("custom-compute", prototype)
         assert duplicate_success is False
     
-    def test_clone_and_customize(self):
+    def test_clone_and_customize(self, isolated_registry):
         """Test: Clonar y personalizar en una operación"""
-        registry = PrototypeRegistry()
+        registry = isolated_registry
         
         customizations = {
             "vm_config": {"vcpus": 8, "memory_gb": 16},
@@ -280,10 +280,26 @@ class TestPrototypeRegistry:
         non_existent = registry.clone_and_customize("non-existent", {})
         assert non_existent is None
     
-    def test_list_templates_by_category(self):
+    def test_clone_and_customize_many(self, isolated_registry):
+        """Test: Clonar un template varias veces con personalizaciones distintas"""
+        registry = isolated_registry
+        
+        clones = registry.clone_and_customize_many("web-server-standard", [
+            {"vm_config": {"vcpus": 8}},
+            None,
+            {"region": "eu-west-1"}
+        ])
+        
+        assert len(clones) == 3
+        assert clones[0].vm_specification.vm_config.vcpus == 8
+        assert clones[1].vm_specification.vm_config.vcpus == 2
+        assert clones[2].vm_specification.region == "eu-west-1"
+        assert clones[0].vm_specification is not clones[1].vm_specification
+        
+        assert registry.clone_and_customize_many("non-existent", [{}]) is None
+    
+    def test_list_templates_by_category(self, registry):
         """Test: Listar templates por categoría"""
-        registry = PrototypeRegistry()
-        
         all_templates = registry.list_templates()
         web_templates = registry.list_templates("web-services")
         db_templates = registry.list_templates("databases")
@@ -296,30 +312,15 @@ class TestPrototypeRegistry:
         for template in web_templates["templates"]:
             assert template["category"] == "web-services"
     
-    def test_remove_template(self):
+    def test_remove_template(self, isolated_registry):
         """Test: Eliminar template del registry"""
-        registry = PrototypeRegistry()
+        registry = isolated_registry
         
         # Agregar template temporal
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=1,
-                memory_gb=1
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=[]
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=10
-            )
+        vm_spec = _make_spec(
+            VMType.STANDARD, Provider.AWS, "us-east-1", size_gb=10,
+            vm={"vcpus": 1, "memory_gb": 1},
+            network={"firewall_rules": []}
         )
         
         temp_prototype = ConcreteVMPrototype(
@@ -348,18 +349,14 @@ class TestPrototypeRegistry:
 class TestVMPrototypeService:
     """Tests para el servicio de gestión de prototipos"""
     
-    def test_service_initialization(self):
+    def test_service_initialization(self, service):
         """Test: Inicialización del servicio"""
-        service = VMPrototypeService()
-        
         assert service.prototype_registry is not None
         assert service.construction_service is not None
         assert service.director is not None
     
-    def test_list_available_templates(self):
+    def test_list_available_templates(self, service):
         """Test: Listar templates disponibles"""
-        service = VMPrototypeService()
-        
         result = service.list_available_templates()
         
         assert result["success"] is True
@@ -373,10 +370,8 @@ class TestVMPrototypeService:
         assert "categories" in stats
         assert "provider_distribution" in stats
     
-    def test_get_template_details(self):
+    def test_get_template_details(self, service):
         """Test: Obtener detalles de template específico"""
-        service = VMPrototypeService()
-        
         result = service.get_template_details("web-server-standard")
         
         assert result["success"] is True
@@ -389,35 +384,37 @@ class TestVMPrototypeService:
         not_found = service.get_template_details("non-existent")
         assert not_found["success"] is False
         assert "error" in not_found
-    
-    def test_register_new_template(self):
+
+    def test_template_details_are_independent_copies(self, service):
+        """Test: Modificar una respuesta no altera las siguientes"""
+        first = service.get_template_details("web-server-standard")
+        original_vcpus = first["vm_specification"]["vm_config"]["vcpus"]
+        first["vm_specification"]["vm_config"]["vcpus"] = 999
+
+        second = service.get_template_details("web-server-standard")
+        assert second["vm_specification"]["vm_config"]["vcpus"] == original_vcpus
+
+    def test_template_info_is_an_independent_copy(self, service):
+        """Test: Modificar la información de un template no altera los listados siguientes"""
+        first = service.get_template_details("web-server-standard")
+        original_vcpus = first["template_info"]["specifications"]["vcpus"]
+        first["template_info"]["specifications"]["vcpus"] = 999
+
+        second = service.get_template_details("web-server-standard")
+        assert second["template_info"]["specifications"]["vcpus"] == original_vcpus
+        listed = service.list_available_templates()
+        web = next(t for t in listed["templates"] if t["template_name"] == "web-server-standard")
+        assert web["specifications"]["vcpus"] == original_vcpus
+
+    def test_register_new_template(self, isolated_service):
         """Test: Registrar nuevo template"""
-        service = VMPrototypeService()
+        service = isolated_service
         
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.ONPREMISE,
-            region="datacenter-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.ONPREMISE,
-                vcpus=4,
-                memory_gb=8,
-                cpu=4,
-                ram=8,
-                hypervisor="vmware"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.ONPREMISE,
-                region="datacenter-1",
-                firewall_rules=["SSH"],
-                network_type="internal"
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.ONPREMISE,
-                region="datacenter-1",
-                size_gb=50,
-                storage_type="ssd"
-            )
+        vm_spec = _make_spec(
+            VMType.STANDARD, Provider.ONPREMISE, "datacenter-1", size_gb=50,
+            vm={"vcpus": 4, "memory_gb": 8, "cpu": 4, "ram": 8, "hypervisor": "vmware"},
+            network={"firewall_rules": ["SSH"], "network_type": "internal"},
+            storage={"storage_type": "ssd"}
         )
         
         result = service.register_template(
@@ -435,30 +432,37 @@ class TestVMPrototypeService:
         details = service.get_template_details("onpremise-test")
         assert details["success"] is True
     
-    def test_delete_template(self):
+    def test_register_templates_batch(self, isolated_service):
+        """Test: Registrar varios templates en una sola llamada"""
+        service = isolated_service
+        
+        vm_spec = _make_spec(
+            VMType.STANDARD, Provider.AWS, "us-east-1", size_gb=20,
+            vm={"vcpus": 2, "memory_gb": 4, "instance_type": "t3.medium"}
+        )
+        
+        results = service.register_templates([
+            {"template_name": "batch-a", "vm_specification": vm_spec, "description": "A"},
+            {"template_name": "batch-b", "vm_specification": vm_spec, "description": "B", "category": "testing"},
+            {"template_name": "batch-a", "vm_specification": vm_spec, "description": "Duplicado"},
+            {"template_name": "batch-c", "vm_specification": vm_spec, "descripcion": "Clave errónea"},
+            {"template_name": "batch-d", "vm_specification": vm_spec, "description": "D"}
+        ])
+        
+        assert [result["success"] for result in results] == [True, True, False, False, True]
+        assert "error" in results[3]
+        assert service.get_template_details("batch-b")["success"] is True
+        assert service.get_template_details("batch-d")["success"] is True
+    
+    def test_delete_template(self, isolated_service):
         """Test: Eliminar template"""
-        service = VMPrototypeService()
+        service = isolated_service
         
         # Crear template temporal primero
-        vm_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=1,
-                memory_gb=1
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=[]
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=10
-            )
+        vm_spec = _make_spec(
+            VMType.STANDARD, Provider.AWS, "us-east-1", size_gb=10,
+            vm={"vcpus": 1, "memory_gb": 1},
+            network={"firewall_rules": []}
         )
         
         service.register_template(
@@ -479,35 +483,21 @@ class TestVMPrototypeService:
         not_found = service.delete_template("non-existent")
         assert not_found["success"] is False
     
-    def test_create_template_from_existing_vm(self):
+    def test_create_template_from_existing_vm(self, isolated_service):
         """Test: Crear template desde VM existente"""
-        service = VMPrototypeService()
-        
-        vm_spec = VMSpecification(
-            vm_type=VMType.MEMORY_OPTIMIZED,
-            provider=Provider.AZURE,
-            region="westus2",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AZURE,
-                vcpus=8,
-                memory_gb=64,
-                memory_optimization=True,
-                size="Standard_E8s_v3",
-                resource_group="production-rg"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AZURE,
-                region="westus2",
-                firewall_rules=["SSH", "HTTPS"],
-                public_ip=False
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AZURE,
-                region="westus2",
-                size_gb=200,
-                storage_type="Premium_SSD",
-                encrypted=True
-            )
+        service = isolated_service
+        
+        vm_spec = _make_spec(
+            VMType.MEMORY_OPTIMIZED, Provider.AZURE, "westus2", size_gb=200,
+            vm={
+                "vcpus": 8,
+                "memory_gb": 64,
+                "memory_optimization": True,
+                "size": "Standard_E8s_v3",
+                "resource_group": "production-rg"
+            },
+            network={"firewall_rules": ["SSH", "HTTPS"], "public_ip": False},
+            storage={"storage_type": "Premium_SSD", "encrypted": True}
         )
         
         result = service.create_template_from_existing_vm(
@@ -529,4 +519,4 @@ class TestVMPrototypeService:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-q", "-x", "--no-header"])
\ No newline at end of file
@@ -1,36 +1,49 @@
 import pytest
-from fastapi.testclient import TestClient
-from api import app
-
-client = TestClient(app)
 
 # ============= CASOS DE PRUEBA PARA FAMILIAS DE RECURSOS =============
 
-def test_provision_aws_resource_family_success():
-    """Prueba exitosa de aprovisionamiento de familia de recursos AWS"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-123456"
-        },
-        "network_params": {
-            "vpcId": "vpc-abc123",
-            "subnet": "subnet-def456",
-            "securityGroup": "sg-ghi789"
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
-        }
-    })
+AWS_FAMILY_REQUEST = {
+    "provider": "aws",
+    "vm_params": {"instance_type": "t2.micro", "region": "us-east-1", "ami": "ami-123456"},
+    "network_params": {"vpcId": "vpc-abc123", "subnet": "subnet-def456", "securityGroup": "sg-ghi789"},
+    "storage_params": {"volumeType": "gp2", "sizeGB": 20, "encrypted": True}
+}
+
+AZURE_FAMILY_REQUEST = {
+    "provider": "azure",
+    "vm_params": {"size": "Standard_B1s", "resource_group": "rg-test", "image": "Ubuntu20.04"},
+    "network_params": {"virtualNetwork": "vnet-test", "subnetName": "subnet-test", "networkSecurityGroup": "nsg-test"},
+    "storage_params": {"diskSku": "Premium_LRS", "sizeGB": 50, "managedDisk": True}
+}
+
+GCP_FAMILY_REQUEST = {
+    "provider": "gcp",
+    "vm_params": {"machine_type": "n1-standard-1", "zone": "us-central1-a", "project": "my-project"},
+    "network_params": {"networkName": "default", "subnetworkName": "default", "firewallTag": "web-server"},
+    "storage_params": {"diskType": "pd-ssd", "sizeGB": 30, "autoDelete": True}
+}
+
+ONPREMISE_FAMILY_REQUEST = {
+    "provider": "onpremise",
+    "vm_params": {"cpu": 4, "ram": 16},
+    "network_params": {"physicalInterface": "eth0", "vlanId": 100, "firewallPolicy": "default"},
+    "storage_params": {"storagePool": "pool1", "sizeGB": 100, "raidLevel": "RAID5"}
+}
+
+@pytest.mark.parametrize("payload,expected_provider", [
+    (AWS_FAMILY_REQUEST, "AWS"),
+    (AZURE_FAMILY_REQUEST, "Azure"),
+    (GCP_FAMILY_REQUEST, "Google Cloud"),
+    (ONPREMISE_FAMILY_REQUEST, "On-Premise"),
+])
+def test_provision_resource_family_success(client, payload, expected_provider):
+    """Prueba exitosa de aprovisionamiento de familia de recursos por proveedor"""
+    response = client.post("/provision_resource_family", json=payload)
     
     data = response.json()
     assert response.status_code == 200
     assert data["success"] is True
-    assert data["provider"] == "AWS"
+    assert data["provider"] == expected_provider
     assert len(data["resources"]) == 3
     
     # Verificar que se crearon los tres tipos de recursos
@@ -39,87 +52,7 @@ def test_provision_aws_resource_family_success():
     assert "storage" in resource_types
     assert "vm" in resource_types
 
-def test_provision_azure_resource_family_success():
-    """Prueba exitosa de aprovisionamiento de familia de recursos Azure"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "azure",
-        "vm_params": {
-            "size": "Standard_B1s",
-            "resource_group": "rg-test",
-            "image": "Ubuntu20.04"
-        },
-        "network_params": {
-            "virtualNetwork": "vnet-test",
-            "subnetName": "subnet-test",
-            "networkSecurityGroup": "nsg-test"
-        },
-        "storage_params": {
-            "diskSku": "Premium_LRS",
-            "sizeGB": 50,
-            "managedDisk": True
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "Azure"
-    assert len(data["resources"]) == 3
-
-def test_provision_gcp_resource_family_success():
-    """Prueba exitosa de aprovisionamiento de familia de recursos GCP"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "gcp",
-        "vm_params": {
-            "machine_type": "n1-standard-1",
-            "zone": "us-central1-a",
-            "project": "my-project"
-        },
-        "network_params": {
-            "networkName": "default",
-            "subnetworkName": "default",
-            "firewallTag": "web-server"
-        },
-        "storage_params": {
-            "diskType": "pd-ssd",
-            "sizeGB": 30,
-            "autoDelete": True
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "Google Cloud"
-    assert len(data["resources"]) == 3
-
-def test_provision_onpremise_resource_family_success():
-    """Prueba exitosa de aprovisionamiento de familia de recursos On-Premise"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "onpremise",
-        "vm_params": {
-            "cpu": 4,
-            "ram": 16
-        },
-        "network_params": {
-            "physicalInterface": "eth0",
-            "vlanId": 100,
-            "firewallPolicy": "default"
-        },
-        "storage_params": {
-            "storagePool": "pool1",
-            "sizeGB": 100,
-            "raidLevel": "RAID5"
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is True
-    assert data["provider"] == "On-Premise"
-    assert len(data["resources"]) == 3
-
-def test_provision_unsupported_provider():
+def test_provision_unsupported_provider(client):
     """Prueba de error con proveedor no soportado"""
     response = client.post("/provision_resource_family", json={
         "provider": "oracle",
@@ -133,87 +66,28 @@ def test_provision_unsupported_provider():
     assert data["success"] is False
     assert "oracle" in data["error"].lower()
 
-def test_provision_missing_network_params():
-    """Prueba de error por parámetros faltantes en red"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-123456"
-        },
-        "network_params": {
-            "vpcId": "vpc-abc123"
-            # Faltan subnet y securityGroup
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is False
-    assert "red" in data["error"].lower()
-
-def test_provision_missing_storage_params():
-    """Prueba de error por parámetros faltantes en almacenamiento"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro",
-            "region": "us-east-1",
-            "ami": "ami-123456"
-        },
-        "network_params": {
-            "vpcId": "vpc-abc123",
-            "subnet": "subnet-def456",
-            "securityGroup": "sg-ghi789"
-        },
-        "storage_params": {
-            "volumeType": "gp2"
-            # Faltan sizeGB y encrypted
-        }
-    })
-    
-    data = response.json()
-    assert response.status_code == 200
-    assert data["success"] is False
-    assert "almacenamiento" in data["error"].lower()
-
-def test_provision_missing_vm_params():
-    """Prueba de error por parámetros faltantes en VM"""
-    response = client.post("/provision_resource_family", json={
-        "provider": "aws",
-        "vm_params": {
-            "instance_type": "t2.micro"
-            # Faltan region y ami
-        },
-        "network_params": {
-            "vpcId": "vpc-abc123",
-            "subnet": "subnet-def456",
-            "securityGroup": "sg-ghi789"
-        },
-        "storage_params": {
-            "volumeType": "gp2",
-            "sizeGB": 20,
-            "encrypted": True
-        }
-    })
+@pytest.mark.parametrize("payload,expected_error", [
+    # Faltan subnet y securityGroup
+    ({**AWS_FAMILY_REQUEST, "network_params": {"vpcId": "vpc-abc123"}}, "red"),
+    # Faltan sizeGB y encrypted
+    ({**AWS_FAMILY_REQUEST, "storage_params": {"volumeType": "gp2"}}, "almacenamiento"),
+    # Faltan region y ami
+    ({**AWS_FAMILY_REQUEST, "vm_params": {"instance_type": "t2.micro"}}, "vm"),
+], ids=["network", "storage", "vm"])
+def test_provision_missing_params(client, payload, expected_error):
+    """Prueba de error por parámetros faltantes en red, almacenamiento o VM"""
+    response = client.post("/provision_resource_family", json=payload)
     
     data = response.json()
     assert response.status_code == 200
     assert data["success"] is False
-    assert "vm" in data["error"].lower()
+    assert expected_error in data["error"].lower()
 
-def test_get_supported_providers():
+def test_get_supported_providers(cached_get):
     """Prueba del endpoint de proveedores soportados"""
-    response = client.get("/supported_providers")
+    status_code, data = cached_get("/supported_providers")
     
-    data = response.json()
-    assert response.status_code == 200
+    assert status_code == 200
     assert "providers" in data
     assert "aws" in data["providers"]
     assert "azure" in data["providers"]
@@ -222,7 +96,7 @@ def test_get_supported_providers():
 
 # ============= CASOS DE PRUEBA PARA ENDPOINT ORIGINAL (COMPATIBILIDAD) =============
 
-def test_original_provision_vm_aws_success():
+def test_original_provision_vm_aws_success(client):
     """Prueba del endpoint original para VM individual"""
     response = client.post("/provision_vm", json={
         "provider": "aws",
@@ -236,4 +110,28 @@ def test_original_provision_vm_aws_success():
     data = response.json()
     assert response.status_code == 200
     assert data["success"] is True
-    assert data["vm_id"] == "aws-vm-123"
\ No newline at end of file
+    assert data["vm_id"] == "aws-vm-123"
+
+# ============= CASOS DE PRUEBA PARA APROVISIONAMIENTO EN LOTE =============
+
+def test_provision_resource_family_batch(client):
+    """Prueba del aprovisionamiento en lote: conserva el orden y aísla los errores"""
+    response = client.post("/provision_resource_family_batch", json={
+        "families": [
+            AWS_FAMILY_REQUEST,
+            {
+                "provider": "oracle",
+                "vm_params": {},
+                "network_params": {},
+                "storage_params": {}
+            }
+        ]
+    })
+    
+    data = response.json()
+    assert response.status_code == 200
+    assert len(data["results"]) == 2
+    assert data["results"][0]["success"] is True
+    assert data["results"][0]["provider"] == "AWS"
+    assert data["results"][1]["success"] is False
+    assert "oracle" in data["results"][1]["error"].lower()
@@ -4,6 +4,7 @@ Permite personalizar la construcción de recursos de manera flexible.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from models_extended import (
     VMSpecification, VirtualMachineConfig, NetworkConfig, StorageConfig,
@@ -11,7 +12,155 @@ from models_extended import (
 )
 from vm_director import VMDirector
 from abstract_factory import AbstractFactoryRegistry
-from logger import safe_log
+from logger import log_enabled, safe_log
+
+# Pool compartido para crear en paralelo red y almacenamiento, que no dependen entre sí;
+# dos tareas por construcción para cada hilo del pool de lotes
+_builder_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vm-builder")
+
+# Registro de factories compartido por los builders que no reciben uno propio
+_default_factory_registry = AbstractFactoryRegistry()
+
+# ============= PARÁMETROS POR PROVEEDOR =============
+# Tablas de despacho construidas una sola vez: Provider -> función que arma los parámetros
+
+def _aws_network_params(config: NetworkConfig) -> Dict[str, Any]:
+    region_slug = config.region.replace('-', '')
+    return {
+        "vpcId": config.vpc_id or f"vpc-{region_slug}",
+        "subnet": config.subnet or f"subnet-{region_slug}",
+        "securityGroup": config.security_group or "sg-default",
+        "region": config.region,
+        "firewallRules": config.firewall_rules,
+        "publicIP": config.public_ip
+    }
+
+def _azure_network_params(config: NetworkConfig) -> Dict[str, Any]:
+    return {
+        "virtualNetwork": config.virtual_network or f"vnet-{config.region}",
+        "subnetName": config.subnet_name or "subnet-default",
+        "networkSecurityGroup": config.network_security_group or "nsg-default",
+        "region": config.region,
+        "firewallRules": config.firewall_rules,
+        "publicIP": config.public_ip
+    }
+
+def _gcp_network_params(config: NetworkConfig) -> Dict[str, Any]:
+    return {
+        "networkName": config.network_name or "default",
+        "subnetworkName": config.subnetwork_name or f"subnet-{config.region}",
+        "firewallTag": config.firewall_tag or "allow-default",
+        "region": config.region,
+        "firewallRules": config.firewall_rules,
+        "publicIP": config.public_ip
+    }
+
+def _onpremise_network_params(config: NetworkConfig) -> Dict[str, Any]:
+    return {
+        "physicalInterface": config.physical_interface or "eth0",
+        "vlanId": config.vlan_id or 100,
+        "firewallPolicy": config.firewall_policy or "allow-default",
+        "region": config.region,
+        "firewallRules": config.firewall_rules,
+        "publicIP": config.public_ip
+    }
+
+def _aws_storage_params(config: StorageConfig) -> Dict[str, Any]:
+    return {
+        "volumeType": config.volume_type or "gp2",
+        "sizeGB": config.size_gb,
+        "encrypted": True if config.encrypted is None else config.encrypted,
+        "region": config.region,
+        "iops": config.iops
+    }
+
+def _azure_storage_params(config: StorageConfig) -> Dict[str, Any]:
+    return {
+        "diskSku": config.disk_sku or "Standard_LRS", 
+        "sizeGB": config.size_gb,
+        "managedDisk": True if config.managed_disk is None else config.managed_disk,
+        "region": config.region,
+        "iops": config.iops
+    }
+
+def _gcp_storage_params(config: StorageConfig) -> Dict[str, Any]:
+    return {
+        "diskType": config.disk_type or "pd-standard",
+        "sizeGB": config.size_gb,
+        "autoDelete": True if config.auto_delete is None else config.auto_delete,
+        "region": config.region,
+        "iops": config.iops
+    }
+
+def _onpremise_storage_params(config: StorageConfig) -> Dict[str, Any]:
+    return {
+        "storagePool": config.storage_pool or "pool-default",
+        "sizeGB": config.size_gb,
+        "raidLevel": config.raid_level or "raid1",
+        "region": config.region,
+        "iops": config.iops
+    }
+
+def _aws_vm_params(config: VirtualMachineConfig, region: str) -> Dict[str, Any]:
+    return {
+        "instance_type": config.instance_type,
+        "region": region,
+        "ami": config.ami
+    }
+
+def _azure_vm_params(config: VirtualMachineConfig, region: str) -> Dict[str, Any]:
+    return {
+        "size": config.size,
+        "resource_group": config.resource_group,
+        "image": config.image,
+        "region": region
+    }
+
+def _gcp_vm_params(config: VirtualMachineConfig, region: str) -> Dict[str, Any]:
+    return {
+        "machine_type": config.machine_type,
+        "zone": region,
+        "project": config.project
+    }
+
+def _onpremise_vm_params(config: VirtualMachineConfig, region: str) -> Dict[str, Any]:
+    return {
+        "cpu": config.cpu or config.vcpus,
+        "ram": config.ram or config.memory_gb,
+        "hypervisor": config.hypervisor or "vmware"
+    }
+
+_NETWORK_PARAM_BUILDERS = {
+    Provider.AWS: _aws_network_params,
+    Provider.AZURE: _azure_network_params,
+    Provider.GCP: _gcp_network_params,
+    Provider.ONPREMISE: _onpremise_network_params
+}
+
+_STORAGE_PARAM_BUILDERS = {
+    Provider.AWS: _aws_storage_params,
+    Provider.AZURE: _azure_storage_params,
+    Provider.GCP: _gcp_storage_params,
+    Provider.ONPREMISE: _onpremise_storage_params
+}
+
+_VM_PARAM_BUILDERS = {
+    Provider.AWS: _aws_vm_params,
+    Provider.AZURE: _azure_vm_params,
+    Provider.GCP: _gcp_vm_params,
+    Provider.ONPREMISE: _onpremise_vm_params
+}
+
+class _ResourceResult:
+    """Resultado de crear un recurso del builder: una sola asignación, sin diccionarios intermedios"""
+    __slots__ = ("success", "resource_id", "error", "info")
+    
+    def __init__(self, success: bool, resource_id: Optional[str] = None,
+                 error: Optional[str] = None, info: Optional[Dict[str, Any]] = None):
+        self.success = success
+        self.resource_id = resource_id
+        self.error = error
+        self.info = info
 
 class VMBuilder(ABC):
     """Builder abstracto para construir VMs paso a paso"""
@@ -47,8 +196,8 @@ class VMBuilder(ABC):
 class ConcreteVMBuilder(VMBuilder):
     """Implementación concreta del Builder para VMs"""
     
-    def __init__(self):
-        self._factory_registry = AbstractFactoryRegistry()
+    def __init__(self, registry: Optional[AbstractFactoryRegistry] = None):
+        self._factory_registry = registry or _default_factory_registry
         super().__init__()
     
     def reset(self):
@@ -63,31 +212,34 @@ class ConcreteVMBuilder(VMBuilder):
         """Establece la configuración de VM"""
         self._vm_config = config
         self._provider = config.provider
-        safe_log(f"Builder: Configurando VM {config.provider}", {
-            "vcpus": config.vcpus,
-            "memory_gb": config.memory_gb,
-            "instance_type": getattr(config, 'instance_type', None)
-        })
+        if log_enabled():
+            safe_log(f"Builder: Configurando VM {config.provider}", {
+                "vcpus": config.vcpus,
+                "memory_gb": config.memory_gb,
+                "instance_type": getattr(config, 'instance_type', None)
+            })
         return self
     
     def set_network_config(self, config: NetworkConfig) -> 'ConcreteVMBuilder':
         """Establece la configuración de red"""
         self._network_config = config
-        safe_log(f"Builder: Configurando Red", {
-            "region": config.region,
-            "firewall_rules": config.firewall_rules,
-            "public_ip": config.public_ip
-        })
+        if log_enabled():
+            safe_log("Builder: Configurando Red", {
+                "region": config.region,
+                "firewall_rules": config.firewall_rules,
+                "public_ip": config.public_ip
+            })
         return self
     
     def set_storage_config(self, config: StorageConfig) -> 'ConcreteVMBuilder':
         """Establece la configuración de almacenamiento"""
         self._storage_config = config
-        safe_log(f"Builder: Configurando Storage", {
-            "region": config.region,
-            "size_gb": config.size_gb,
-            "iops": config.iops
-        })
+        if log_enabled():
+            safe_log("Builder: Configurando Storage", {
+                "region": config.region,
+                "size_gb": config.size_gb,
+                "iops": config.iops
+            })
         return self
     
     def build(self) -> Dict[str, Any]:
@@ -102,22 +254,38 @@ class ConcreteVMBuilder(VMBuilder):
             # Obtener factory del proveedor
             factory = self._factory_registry.get_factory(self._provider.value)
             
-            # Crear recursos en orden: Network -> Storage -> VM
-            network_result = self._create_network_resource(factory)
-            if not network_result["success"]:
-                return network_result
+            # Network y Storage se crean en paralelo; la VM espera a ambos
+            network_future = _builder_executor.submit(self._create_network_resource, factory)
+            storage_future = _builder_executor.submit(self._create_storage_resource, factory)
             
-            storage_result = self._create_storage_resource(factory)
-            if not storage_result["success"]:
-                return storage_result
+            # Los recursos se registran en orden Network -> Storage -> VM
+            network_result = network_future.result()
+            if not network_result.success:
+                # El almacenamiento pudo crearse en paralelo: se reporta para no perder su id
+                if not storage_future.cancel():
+                    storage_result = storage_future.result()
+                    if storage_result.success:
+                        self._created_resources.append(storage_result.info)
+                return {
+                    "success": False,
+                    "error": network_result.error,
+                    "resources": self._created_resources
+                }
+            self._created_resources.append(network_result.info)
+            
+            storage_result = storage_future.result()
+            if not storage_result.success:
+                return {"success": False, "error": storage_result.error}
+            self._created_resources.append(storage_result.info)
             
             vm_result = self._create_vm_resource(
                 factory, 
-                network_result["resource_id"], 
-                storage_result["resource_id"]
+                network_result.resource_id, 
+                storage_result.resource_id
             )
-            if not vm_result["success"]:
-                return vm_result
+            if not vm_result.success:
+                return {"success": False, "error": vm_result.error}
+            self._created_resources.append(vm_result.info)
             
             # Compilar respuesta exitosa
             return {
@@ -125,9 +293,9 @@ class ConcreteVMBuilder(VMBuilder):
                 "provider": self._provider.value.upper(),
                 "resources": self._created_resources,
                 "vm_specification": {
-                    "vm_config": self._vm_config.dict(),
-                    "network_config": self._network_config.dict(),
-                    "storage_config": self._storage_config.dict()
+                    "vm_config": self._vm_config.model_dump(),
+                    "network_config": self._network_config.model_dump(),
+                    "storage_config": self._storage_config.model_dump()
                 }
             }
             
@@ -151,7 +319,7 @@ class ConcreteVMBuilder(VMBuilder):
         if not self._provider:
             raise ValueError("Proveedor no establecido")
     
-    def _create_network_resource(self, factory) -> Dict[str, Any]:
+    def _create_network_resource(self, factory) -> _ResourceResult:
         """Crea el recurso de red"""
         try:
             network = factory.create_network()
@@ -168,15 +336,14 @@ class ConcreteVMBuilder(VMBuilder):
                     "status": "provisioned",
                     "details": network_params
                 }
-                self._created_resources.append(resource_info)
-                return {"success": True, "resource_id": resource_id}
+                return _ResourceResult(True, resource_id, info=resource_info)
             else:
-                return {"success": False, "error": error}
+                return _ResourceResult(False, error=error)
                 
         except Exception as e:
-            return {"success": False, "error": f"Error creando red: {str(e)}"}
+            return _ResourceResult(False, error=f"Error creando red: {str(e)}")
     
-    def _create_storage_resource(self, factory) -> Dict[str, Any]:
+    def _create_storage_resource(self, factory) -> _ResourceResult:
         """Crea el recurso de almacenamiento"""
         try:
             storage = factory.create_storage()
@@ -193,15 +360,14 @@ class ConcreteVMBuilder(VMBuilder):
                     "status": "provisioned", 
                     "details": storage_params
                 }
-                self._created_resources.append(resource_info)
-                return {"success": True, "resource_id": resource_id}
+                return _ResourceResult(True, resource_id, info=resource_info)
             else:
-                return {"success": False, "error": error}
+                return _ResourceResult(False, error=error)
                 
         except Exception as e:
-            return {"success": False, "error": f"Error creando almacenamiento: {str(e)}"}
+            return _ResourceResult(False, error=f"Error creando almacenamiento: {str(e)}")
     
-    def _create_vm_resource(self, factory, network_id: str, storage_id: str) -> Dict[str, Any]:
+    def _create_vm_resource(self, factory, network_id: str, storage_id: str) -> _ResourceResult:
         """Crea el recurso de VM asociado a red y almacenamiento"""
         try:
             vm = factory.create_vm()
@@ -222,91 +388,20 @@ class ConcreteVMBuilder(VMBuilder):
                         "storage_id": storage_id
                     }
                 }
-                self._created_resources.append(resource_info)
-                return {"success": True, "resource_id": resource_id}
+                return _ResourceResult(True, resource_id, info=resource_info)
             else:
-                return {"success": False, "error": error}
+                return _ResourceResult(False, error=error)
                 
         except Exception as e:
-            return {"success": False, "error": f"Error creando VM: {str(e)}"}
+            return _ResourceResult(False, error=f"Error creando VM: {str(e)}")
     
     def _prepare_network_params(self) -> Dict[str, Any]:
         """Prepara los parámetros de red según el proveedor"""
-        config = self._network_config
-        
-        if self._provider == Provider.AWS:
-            return {
-                "vpcId": config.vpc_id or f"vpc-{config.region.replace('-', '')}",
-                "subnet": config.subnet or f"subnet-{config.region.replace('-', '')}",
-                "securityGroup": config.security_group or "sg-default",
-                "region": config.region,
-                "firewallRules": config.firewall_rules,
-                "publicIP": config.public_ip
-            }
-        elif self._provider == Provider.AZURE:
-            return {
-                "virtualNetwork": config.virtual_network or f"vnet-{config.region}",
-                "subnetName": config.subnet_name or "subnet-default",
-                "networkSecurityGroup": config.network_security_group or "nsg-default",
-                "region": config.region,
-                "firewallRules": config.firewall_rules,
-                "publicIP": config.public_ip
-            }
-        elif self._provider == Provider.GCP:
-            return {
-                "networkName": config.network_name or "default",
-                "subnetworkName": config.subnetwork_name or f"subnet-{config.region}",
-                "firewallTag": config.firewall_tag or "allow-default",
-                "region": config.region,
-                "firewallRules": config.firewall_rules,
-                "publicIP": config.public_ip
-            }
-        elif self._provider == Provider.ONPREMISE:
-            return {
-                "physicalInterface": config.physical_interface or "eth0",
-                "vlanId": config.vlan_id or 100,
-                "firewallPolicy": config.firewall_policy or "allow-default",
-                "region": config.region,
-                "firewallRules": config.firewall_rules,
-                "publicIP": config.public_ip
-            }
+        return _NETWORK_PARAM_BUILDERS[self._provider](self._network_config)
     
     def _prepare_storage_params(self) -> Dict[str, Any]:
         """Prepara los parámetros de almacenamiento según el proveedor"""
-        config = self._storage_config
-        
-        if self._provider == Provider.AWS:
-            return {
-                "volumeType": config.volume_type or "gp2",
-                "sizeGB": config.size_gb,
-                "encrypted": config.encrypted or True,
-                "region": config.region,
-                "iops": config.iops
-            }
-        elif self._provider == Provider.AZURE:
-            return {
-                "diskSku": config.disk_sku or "Standard_LRS", 
-                "sizeGB": config.size_gb,
-                "managedDisk": config.managed_disk or True,
-                "region": config.region,
-                "iops": config.iops
-            }
-        elif self._provider == Provider.GCP:
-            return {
-                "diskType": config.disk_type or "pd-standard",
-                "sizeGB": config.size_gb,
-                "autoDelete": config.auto_delete or True,
-                "region": config.region,
-                "iops": config.iops
-            }
-        elif self._provider == Provider.ONPREMISE:
-            return {
-                "storagePool": config.storage_pool or "pool-default",
-                "sizeGB": config.size_gb,
-                "raidLevel": config.raid_level or "raid1",
-                "region": config.region,
-                "iops": config.iops
-            }
+        return _STORAGE_PARAM_BUILDERS[self._provider](self._storage_config)
     
     def _prepare_vm_params(self) -> Dict[str, Any]:
         """Prepara los parámetros de VM según el proveedor"""
@@ -319,33 +414,5 @@ class ConcreteVMBuilder(VMBuilder):
             "diskOptimization": config.disk_optimization,
             "keyPairName": config.key_pair_name
         }
-        
-        if self._provider == Provider.AWS:
-            return {
-                **base_params,
-                "instance_type": config.instance_type,
-                "region": self._network_config.region,
-                "ami": config.ami
-            }
-        elif self._provider == Provider.AZURE:
-            return {
-                **base_params,
-                "size": config.size,
-                "resource_group": config.resource_group,
-                "image": config.image,
-                "region": self._network_config.region
-            }
-        elif self._provider == Provider.GCP:
-            return {
-                **base_params,
-                "machine_type": config.machine_type,
-                "zone": self._network_config.region,
-                "project": config.project
-            }
-        elif self._provider == Provider.ONPREMISE:
-            return {
-                **base_params,
-                "cpu": config.cpu or config.vcpus,
-                "ram": config.ram or config.memory_gb,
-                "hypervisor": config.hypervisor or "vmware"
-            }
\ No newline at end of file
+        base_params.update(_VM_PARAM_BUILDERS[self._provider](config, self._network_config.region))
+        return base_params
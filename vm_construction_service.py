@@ -3,13 +3,29 @@ Servicio de construcción de VMs que integra Director + Builder + Abstract Facto
 Orquesta todo el proceso de construcción de VMs con el patrón combinado.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, LifoQueue
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 from models_extended import (
     BuilderRequest, BuilderResponse, VMSpecification, VMType, Provider
 )
 from vm_director import VMDirector
 from vm_builder import ConcreteVMBuilder
-from logger import safe_log
+from abstract_factory import AbstractFactoryRegistry
+from logger import log_enabled, safe_log
+
+# Pool acotado para los lotes; separado del pool del builder porque cada
+# construcción espera en él a sus recursos
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vm-construction-batch")
+
+# Regiones soportadas por proveedor, construidas una sola vez al importar
+_SUPPORTED_REGIONS = MappingProxyType({
+    Provider.AWS: ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"],
+    Provider.AZURE: ["eastus", "westus2", "westeurope", "southeastasia"],
+    Provider.GCP: ["us-central1", "us-west1", "europe-west1", "asia-southeast1"],
+    Provider.ONPREMISE: ["datacenter-1", "datacenter-2", "edge-location-1"]
+})
 
 class VMConstructionService:
     """
@@ -19,6 +35,22 @@ class VMConstructionService:
     
     def __init__(self):
         self.director = VMDirector()
+        # Registro de factories y builders reutilizables entre peticiones
+        self._registry = AbstractFactoryRegistry()
+        self._builder_pool: LifoQueue = LifoQueue()
+    
+    def acquire_builder(self) -> ConcreteVMBuilder:
+        """Obtiene un builder del pool (o crea uno nuevo) listo para usarse"""
+        try:
+            builder = self._builder_pool.get_nowait()
+        except Empty:
+            return ConcreteVMBuilder(self._registry)
+        builder.reset()
+        return builder
+    
+    def release_builder(self, builder: ConcreteVMBuilder) -> None:
+        """Devuelve un builder al pool para reutilizarlo"""
+        self._builder_pool.put_nowait(builder)
     
     def build_vm(
         self, 
@@ -46,10 +78,11 @@ class VMConstructionService:
             BuilderResponse: Resultado de la construcción
         """
         
-        safe_log(f"VMConstruction: Iniciando construcción {vm_type} en {provider}", {
-            "region": region,
-            "flavor": flavor
-        })
+        if log_enabled():
+            safe_log(f"VMConstruction: Iniciando construcción {vm_type} en {provider}", {
+                "region": region,
+                "flavor": flavor
+            })
         
         try:
             # 1. Director crea la especificación base
@@ -69,29 +102,33 @@ class VMConstructionService:
                 self._apply_storage_overrides(vm_specification, custom_storage_config)
             
             # 3. Builder construye la VM paso a paso
-            builder = ConcreteVMBuilder()
-            result = (builder
-                     .set_vm_config(vm_specification.vm_config)
-                     .set_network_config(vm_specification.network_config)  
-                     .set_storage_config(vm_specification.storage_config)
-                     .build())
+            builder = self.acquire_builder()
+            try:
+                result = (builder
+                         .set_vm_config(vm_specification.vm_config)
+                         .set_network_config(vm_specification.network_config)  
+                         .set_storage_config(vm_specification.storage_config)
+                         .build())
+            finally:
+                self.release_builder(builder)
             
             # 4. Preparar respuesta
             if result["success"]:
-                return BuilderResponse(
+                return BuilderResponse.model_construct(
                     success=True,
                     vm_specification=vm_specification,
                     created_resources=result["resources"]
                 )
             else:
-                return BuilderResponse(
+                return BuilderResponse.model_construct(
                     success=False,
+                    created_resources=result.get("resources") or None,
                     error=result["error"]
                 )
                 
         except Exception as e:
             safe_log("VMConstruction: Error durante construcción", {"error": str(e)})
-            return BuilderResponse(
+            return BuilderResponse.model_construct(
                 success=False,
                 error=f"Error en construcción: {str(e)}"
             )
@@ -110,6 +147,20 @@ class VMConstructionService:
             custom_storage_config=request.custom_storage_config
         )
     
+    def build_vms_from_requests(self, requests: List[BuilderRequest]) -> List[BuilderResponse]:
+        """
+        Construye varias VMs de forma concurrente.
+        
+        Los resultados conservan el orden de entrada; si una construcción falla,
+        las demás continúan.
+        """
+        if not requests:
+            return []
+        
+        safe_log("VMConstruction: Iniciando construcción en lote", {"total": len(requests)})
+        
+        return list(_batch_executor.map(self.build_vm_from_request, requests))
+    
     def get_available_configurations(self, provider: Provider) -> Dict[str, Any]:
         """
         Obtiene las configuraciones disponibles para un proveedor.
@@ -142,17 +193,12 @@ class VMConstructionService:
         Permite verificar compatibilidad sin crear recursos.
         """
         try:
-            # Intentar obtener especificación del Director
-            specification = self.director.get_vm_specification(
-                provider=provider,
-                vm_type=vm_type,
-                region=region,
-                flavor=flavor
-            )
+            # Intentar obtener especificación del Director (memorizada: aquí solo se lee)
+            specification = self.director.get_vm_specification(provider, vm_type, region, flavor)
             
             return {
                 "valid": True,
-                "specification": specification.dict(),
+                "specification": specification.model_dump(),
                 "estimated_cost": self._estimate_cost(specification),
                 "warnings": self._get_configuration_warnings(specification)
             }
@@ -166,32 +212,31 @@ class VMConstructionService:
     
     def _apply_network_overrides(self, specification: VMSpecification, overrides: Dict[str, Any]):
         """Aplica configuraciones personalizadas de red"""
-        for key, value in overrides.items():
-            if hasattr(specification.network_config, key):
-                setattr(specification.network_config, key, value)
+        config = specification.network_config
+        fields = type(config).model_fields
+        specification.network_config = config.model_copy(
+            update={key: value for key, value in overrides.items() if key in fields}
+        )
     
     def _apply_storage_overrides(self, specification: VMSpecification, overrides: Dict[str, Any]):
         """Aplica configuraciones personalizadas de almacenamiento"""
-        for key, value in overrides.items():
-            if hasattr(specification.storage_config, key):
-                setattr(specification.storage_config, key, value)
+        config = specification.storage_config
+        fields = type(config).model_fields
+        specification.storage_config = config.model_copy(
+            update={key: value for key, value in overrides.items() if key in fields}
+        )
     
     def _get_supported_regions(self, provider: Provider) -> list[str]:
         """Obtiene las regiones soportadas por proveedor"""
-        regions_map = {
-            Provider.AWS: ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"],
-            Provider.AZURE: ["eastus", "westus2", "westeurope", "southeastasia"],
-            Provider.GCP: ["us-central1", "us-west1", "europe-west1", "asia-southeast1"],
-            Provider.ONPREMISE: ["datacenter-1", "datacenter-2", "edge-location-1"]
-        }
-        return regions_map.get(provider, [])
+        return _SUPPORTED_REGIONS.get(provider, [])
     
     def _get_default_configs(self, provider: Provider) -> Dict[str, Any]:
         """Obtiene configuraciones por defecto del proveedor"""
+        regions = self._get_supported_regions(provider)
         return {
             "default_vm_type": VMType.STANDARD,
             "default_flavor": "medium",
-            "default_region": self._get_supported_regions(provider)[0] if self._get_supported_regions(provider) else None,
+            "default_region": regions[0] if regions else None,
             "network_defaults": {
                 "firewall_rules": ["SSH", "HTTP", "HTTPS"],
                 "public_ip": True
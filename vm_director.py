@@ -1,14 +1,260 @@
 """
 Implementación del patrón Director para orquestar la construcción de diferentes tipos de VM.
 Define las especificaciones de hardware para cada proveedor y tipo de VM.
+
+Las configuraciones internas se arman con model_construct a partir de tablas
+estáticas; solo se validan los overrides que llegan del usuario.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Tuple
 from models_extended import (
     VMType, Provider, VMSpecification, VirtualMachineConfig, 
     NetworkConfig, StorageConfig
 )
 
+class _SpecEntry(NamedTuple):
+    """Flavors disponibles y flavor por defecto de un (proveedor, tipo de VM)"""
+    flavors: Mapping[str, Mapping[str, Any]]
+    default_flavor: str
+
+def _freeze_flavors(flavors: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Convierte los flavors en mapeos de solo lectura, seguros para compartir entre hilos"""
+    return MappingProxyType({name: MappingProxyType(config) for name, config in flavors.items()})
+
+# ============= ESPECIFICACIONES POR PROVEEDOR Y TIPO =============
+# Tabla plana construida una sola vez al importar: (Provider, VMType) -> _SpecEntry
+
+_VM_SPECS: Dict[Tuple[Provider, VMType], _SpecEntry] = {
+    (Provider.AWS, VMType.STANDARD): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"instance_type": "t3.medium", "vcpus": 2, "memory_gb": 4},
+            "medium": {"instance_type": "m5.large", "vcpus": 2, "memory_gb": 8},
+            "large": {"instance_type": "m5.xlarge", "vcpus": 4, "memory_gb": 16}
+        }),
+        default_flavor="medium"
+    ),
+    (Provider.AWS, VMType.MEMORY_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"instance_type": "r5.large", "vcpus": 2, "memory_gb": 16},
+            "medium": {"instance_type": "r5.xlarge", "vcpus": 4, "memory_gb": 32},
+            "large": {"instance_type": "r5.2xlarge", "vcpus": 8, "memory_gb": 64}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.AWS, VMType.COMPUTE_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"instance_type": "c5.large", "vcpus": 2, "memory_gb": 4},
+            "medium": {"instance_type": "c5.xlarge", "vcpus": 4, "memory_gb": 8},
+            "large": {"instance_type": "c5.2xlarge", "vcpus": 8, "memory_gb": 16}
+        }),
+        default_flavor="medium"
+    ),
+    (Provider.AZURE, VMType.STANDARD): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"size": "D2s_v3", "vcpus": 2, "memory_gb": 8},
+            "medium": {"size": "D4s_v3", "vcpus": 4, "memory_gb": 16},
+            "large": {"size": "D8s_v3", "vcpus": 8, "memory_gb": 32}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.AZURE, VMType.MEMORY_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"size": "E2s_v3", "vcpus": 2, "memory_gb": 16},
+            "medium": {"size": "E4s_v3", "vcpus": 4, "memory_gb": 32},
+            "large": {"size": "E8s_v3", "vcpus": 8, "memory_gb": 64}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.AZURE, VMType.COMPUTE_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"size": "F2s_v2", "vcpus": 2, "memory_gb": 4},
+            "medium": {"size": "F4s_v2", "vcpus": 4, "memory_gb": 8},
+            "large": {"size": "F8s_v2", "vcpus": 8, "memory_gb": 16}
+        }),
+        default_flavor="medium"
+    ),
+    (Provider.GCP, VMType.STANDARD): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"machine_type": "e2-standard-2", "vcpus": 2, "memory_gb": 8},
+            "medium": {"machine_type": "e2-standard-4", "vcpus": 4, "memory_gb": 16},
+            "large": {"machine_type": "e2-standard-8", "vcpus": 8, "memory_gb": 32}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.GCP, VMType.MEMORY_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"machine_type": "n2-highmem-2", "vcpus": 2, "memory_gb": 16},
+            "medium": {"machine_type": "n2-highmem-4", "vcpus": 4, "memory_gb": 32},
+            "large": {"machine_type": "n2-highmem-8", "vcpus": 8, "memory_gb": 64}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.GCP, VMType.COMPUTE_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"machine_type": "n2-highcpu-2", "vcpus": 2, "memory_gb": 2},
+            "medium": {"machine_type": "n2-highcpu-4", "vcpus": 4, "memory_gb": 4},
+            "large": {"machine_type": "n2-highcpu-8", "vcpus": 8, "memory_gb": 8}
+        }),
+        default_flavor="medium"
+    ),
+    (Provider.ONPREMISE, VMType.STANDARD): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"flavor": "onprem-std1", "vcpus": 2, "memory_gb": 4},
+            "medium": {"flavor": "onprem-std2", "vcpus": 4, "memory_gb": 8},
+            "large": {"flavor": "onprem-std3", "vcpus": 8, "memory_gb": 16}
+        }),
+        default_flavor="medium"
+    ),
+    (Provider.ONPREMISE, VMType.MEMORY_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"flavor": "onprem-mem1", "vcpus": 2, "memory_gb": 16},
+            "medium": {"flavor": "onprem-mem2", "vcpus": 4, "memory_gb": 32},
+            "large": {"flavor": "onprem-mem3", "vcpus": 8, "memory_gb": 64}
+        }),
+        default_flavor="small"
+    ),
+    (Provider.ONPREMISE, VMType.COMPUTE_OPTIMIZED): _SpecEntry(
+        flavors=_freeze_flavors({
+            "small": {"flavor": "onprem-cpu1", "vcpus": 2, "memory_gb": 2},
+            "medium": {"flavor": "onprem-cpu2", "vcpus": 4, "memory_gb": 4},
+            "large": {"flavor": "onprem-cpu3", "vcpus": 8, "memory_gb": 8}
+        }),
+        default_flavor="medium"
+    )
+}
+
+def _available_vm_types(provider: Provider) -> Dict[VMType, Dict[str, Any]]:
+    """Resumen de tipos de VM y flavors de un proveedor, con dicts simples serializables a JSON"""
+    result = {}
+    for vm_type in VMType:
+        spec = _VM_SPECS.get((provider, vm_type))
+        if spec is not None:
+            result[vm_type] = {
+                "flavors": list(spec.flavors),
+                "default_flavor": spec.default_flavor,
+                "configurations": {name: dict(config) for name, config in spec.flavors.items()}
+            }
+    return result
+
+# Las especificaciones no cambian en ejecución: el resumen por proveedor se arma una sola vez
+_AVAILABLE_VM_TYPES = MappingProxyType({provider: _available_vm_types(provider) for provider in Provider})
+
+# ============= PARÁMETROS ESPECÍFICOS POR PROVEEDOR =============
+# Tablas de despacho construidas una sola vez: Provider -> función con los campos propios
+
+_AWS_DEFAULT_AMI = "ami-0c02fb55956c7d316"  # Amazon Linux 2
+_AZURE_DEFAULT_RESOURCE_GROUP = "rg-default"
+_GCP_DEFAULT_PROJECT = "default-project"
+
+def _aws_vm_extra(vm_type: VMType, flavor_config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "instance_type": flavor_config["instance_type"],
+        "ami": _AWS_DEFAULT_AMI
+    }
+
+def _azure_vm_extra(vm_type: VMType, flavor_config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "size": flavor_config["size"],
+        "resource_group": _AZURE_DEFAULT_RESOURCE_GROUP,
+        "image": "UbuntuLTS"
+    }
+
+def _gcp_vm_extra(vm_type: VMType, flavor_config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "machine_type": flavor_config["machine_type"],
+        "project": _GCP_DEFAULT_PROJECT
+    }
+
+def _onpremise_vm_extra(vm_type: VMType, flavor_config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "cpu": flavor_config["vcpus"],
+        "ram": flavor_config["memory_gb"],
+        "hypervisor": "vmware"
+    }
+
+def _aws_network_extra(region: str, vm_type: VMType) -> Dict[str, Any]:
+    region_slug = region.replace('-', '')
+    return {
+        "vpc_id": f"vpc-{region_slug}",
+        "subnet": f"subnet-{region_slug}",
+        "security_group": f"sg-{vm_type.value}"
+    }
+
+def _azure_network_extra(region: str, vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "virtual_network": f"vnet-{region}",
+        "subnet_name": f"subnet-{vm_type.value}",
+        "network_security_group": f"nsg-{vm_type.value}"
+    }
+
+def _gcp_network_extra(region: str, vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "network_name": "default",
+        "subnetwork_name": f"subnet-{region}",
+        "firewall_tag": f"allow-{vm_type.value}"
+    }
+
+def _onpremise_network_extra(region: str, vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "physical_interface": "eth0",
+        "vlan_id": 100,
+        "firewall_policy": f"policy-{vm_type.value}"
+    }
+
+def _aws_storage_extra(vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "volume_type": "gp3" if vm_type == VMType.COMPUTE_OPTIMIZED else "gp2",
+        "encrypted": True
+    }
+
+def _azure_storage_extra(vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "disk_sku": "Premium_LRS" if vm_type == VMType.MEMORY_OPTIMIZED else "Standard_LRS",
+        "managed_disk": True
+    }
+
+def _gcp_storage_extra(vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "disk_type": "pd-ssd" if vm_type == VMType.COMPUTE_OPTIMIZED else "pd-standard",
+        "auto_delete": True
+    }
+
+def _onpremise_storage_extra(vm_type: VMType) -> Dict[str, Any]:
+    return {
+        "storage_pool": f"pool-{vm_type.value}",
+        "raid_level": "raid1"
+    }
+
+_VM_EXTRA = {
+    Provider.AWS: _aws_vm_extra,
+    Provider.AZURE: _azure_vm_extra,
+    Provider.GCP: _gcp_vm_extra,
+    Provider.ONPREMISE: _onpremise_vm_extra
+}
+
+_NETWORK_EXTRA = {
+    Provider.AWS: _aws_network_extra,
+    Provider.AZURE: _azure_network_extra,
+    Provider.GCP: _gcp_network_extra,
+    Provider.ONPREMISE: _onpremise_network_extra
+}
+
+_STORAGE_EXTRA = {
+    Provider.AWS: _aws_storage_extra,
+    Provider.AZURE: _azure_storage_extra,
+    Provider.GCP: _gcp_storage_extra,
+    Provider.ONPREMISE: _onpremise_storage_extra
+}
+
+# Tamaño base del disco según tipo de VM
+_BASE_STORAGE_SIZE_GB = MappingProxyType({
+    VMType.STANDARD: 50,
+    VMType.MEMORY_OPTIMIZED: 100,
+    VMType.COMPUTE_OPTIMIZED: 30
+})
+
 class VMDirector:
     """
     Director que define las políticas de construcción y valores de recursos
@@ -16,116 +262,8 @@ class VMDirector:
     """
     
     def __init__(self):
-        self._vm_specifications = self._initialize_vm_specs()
-    
-    def _initialize_vm_specs(self) -> Dict[Provider, Dict[VMType, Dict[str, Any]]]:
-        """Inicializa las especificaciones de VM por proveedor y tipo"""
-        return {
-            Provider.AWS: {
-                VMType.STANDARD: {
-                    "flavors": {
-                        "small": {"instance_type": "t3.medium", "vcpus": 2, "memory_gb": 4},
-                        "medium": {"instance_type": "m5.large", "vcpus": 2, "memory_gb": 8},
-                        "large": {"instance_type": "m5.xlarge", "vcpus": 4, "memory_gb": 16}
-                    },
-                    "default_flavor": "medium"
-                },
-                VMType.MEMORY_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"instance_type": "r5.large", "vcpus": 2, "memory_gb": 16},
-                        "medium": {"instance_type": "r5.xlarge", "vcpus": 4, "memory_gb": 32},
-                        "large": {"instance_type": "r5.2xlarge", "vcpus": 8, "memory_gb": 64}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.COMPUTE_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"instance_type": "c5.large", "vcpus": 2, "memory_gb": 4},
-                        "medium": {"instance_type": "c5.xlarge", "vcpus": 4, "memory_gb": 8},
-                        "large": {"instance_type": "c5.2xlarge", "vcpus": 8, "memory_gb": 16}
-                    },
-                    "default_flavor": "medium"
-                }
-            },
-            Provider.AZURE: {
-                VMType.STANDARD: {
-                    "flavors": {
-                        "small": {"size": "D2s_v3", "vcpus": 2, "memory_gb": 8},
-                        "medium": {"size": "D4s_v3", "vcpus": 4, "memory_gb": 16},
-                        "large": {"size": "D8s_v3", "vcpus": 8, "memory_gb": 32}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.MEMORY_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"size": "E2s_v3", "vcpus": 2, "memory_gb": 16},
-                        "medium": {"size": "E4s_v3", "vcpus": 4, "memory_gb": 32},
-                        "large": {"size": "E8s_v3", "vcpus": 8, "memory_gb": 64}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.COMPUTE_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"size": "F2s_v2", "vcpus": 2, "memory_gb": 4},
-                        "medium": {"size": "F4s_v2", "vcpus": 4, "memory_gb": 8},
-                        "large": {"size": "F8s_v2", "vcpus": 8, "memory_gb": 16}
-                    },
-                    "default_flavor": "medium"
-                }
-            },
-            Provider.GCP: {
-                VMType.STANDARD: {
-                    "flavors": {
-                        "small": {"machine_type": "e2-standard-2", "vcpus": 2, "memory_gb": 8},
-                        "medium": {"machine_type": "e2-standard-4", "vcpus": 4, "memory_gb": 16},
-                        "large": {"machine_type": "e2-standard-8", "vcpus": 8, "memory_gb": 32}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.MEMORY_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"machine_type": "n2-highmem-2", "vcpus": 2, "memory_gb": 16},
-                        "medium": {"machine_type": "n2-highmem-4", "vcpus": 4, "memory_gb": 32},
-                        "large": {"machine_type": "n2-highmem-8", "vcpus": 8, "memory_gb": 64}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.COMPUTE_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"machine_type": "n2-highcpu-2", "vcpus": 2, "memory_gb": 2},
-                        "medium": {"machine_type": "n2-highcpu-4", "vcpus": 4, "memory_gb": 4},
-                        "large": {"machine_type": "n2-highcpu-8", "vcpus": 8, "memory_gb": 8}
-                    },
-                    "default_flavor": "medium"
-                }
-            },
-            Provider.ONPREMISE: {
-                VMType.STANDARD: {
-                    "flavors": {
-                        "small": {"flavor": "onprem-std1", "vcpus": 2, "memory_gb": 4},
-                        "medium": {"flavor": "onprem-std2", "vcpus": 4, "memory_gb": 8},
-                        "large": {"flavor": "onprem-std3", "vcpus": 8, "memory_gb": 16}
-                    },
-                    "default_flavor": "medium"
-                },
-                VMType.MEMORY_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"flavor": "onprem-mem1", "vcpus": 2, "memory_gb": 16},
-                        "medium": {"flavor": "onprem-mem2", "vcpus": 4, "memory_gb": 32},
-                        "large": {"flavor": "onprem-mem3", "vcpus": 8, "memory_gb": 64}
-                    },
-                    "default_flavor": "small"
-                },
-                VMType.COMPUTE_OPTIMIZED: {
-                    "flavors": {
-                        "small": {"flavor": "onprem-cpu1", "vcpus": 2, "memory_gb": 2},
-                        "medium": {"flavor": "onprem-cpu2", "vcpus": 4, "memory_gb": 4},
-                        "large": {"flavor": "onprem-cpu3", "vcpus": 8, "memory_gb": 8}
-                    },
-                    "default_flavor": "medium"
-                }
-            }
-        }
+        # Especificaciones sin overrides memorizadas por (provider, vm_type, region, flavor)
+        self._cached_specification = lru_cache(maxsize=512)(self._build_specification)
     
     def get_vm_specification(
         self, 
@@ -148,22 +286,44 @@ class VMDirector:
         Returns:
             VMSpecification: Especificación completa de la VM
         """
-        if provider not in self._vm_specifications:
-            raise ValueError(f"Proveedor {provider} no soportado")
-            
-        if vm_type not in self._vm_specifications[provider]:
+        spec_data = _VM_SPECS.get((provider, vm_type))
+        if spec_data is None:
+            if not any(key[0] == provider for key in _VM_SPECS):
+                raise ValueError(f"Proveedor {provider} no soportado")
             raise ValueError(f"Tipo de VM {vm_type} no soportado para {provider}")
         
-        spec_data = self._vm_specifications[provider][vm_type]
-        
         # Usar flavor por defecto si no se especifica
-        if not flavor:
-            flavor = spec_data["default_flavor"]
-        
-        if flavor not in spec_data["flavors"]:
+        flavor_name = flavor or spec_data.default_flavor
+        flavor_config = spec_data.flavors.get(flavor_name)
+        if flavor_config is None:
             raise ValueError(f"Flavor {flavor} no disponible para {provider} {vm_type}")
         
-        flavor_config = spec_data["flavors"][flavor]
+        if custom_overrides:
+            return self._build_specification(provider, vm_type, region, flavor_name, custom_overrides)
+        
+        # Copia de los modelos y de la lista de reglas: el llamador puede modificarlos
+        # sin alterar la caché
+        cached = self._cached_specification(provider, vm_type, region, flavor_name)
+        network_config = cached.network_config
+        firewall_rules = network_config.firewall_rules
+        return cached.model_copy(update={
+            "vm_config": cached.vm_config.model_copy(),
+            "network_config": network_config.model_copy(update={
+                "firewall_rules": list(firewall_rules) if firewall_rules is not None else None
+            }),
+            "storage_config": cached.storage_config.model_copy()
+        })
+    
+    def _build_specification(
+        self,
+        provider: Provider,
+        vm_type: VMType,
+        region: str,
+        flavor: str,
+        custom_overrides: Dict[str, Any] = None
+    ) -> VMSpecification:
+        """Construye y valida una especificación completa a partir del flavor ya resuelto"""
+        flavor_config = _VM_SPECS[(provider, vm_type)].flavors[flavor]
         
         # Construir configuración de VM
         vm_config = self._build_vm_config(provider, vm_type, flavor_config, custom_overrides)
@@ -174,7 +334,7 @@ class VMDirector:
         # Construir configuración de almacenamiento
         storage_config = self._build_storage_config(provider, region, vm_type)
         
-        return VMSpecification(
+        return VMSpecification.model_construct(
             vm_type=vm_type,
             provider=provider,
             region=region,
@@ -203,34 +363,15 @@ class VMDirector:
         }
         
         # Agregar parámetros específicos del proveedor
-        if provider == Provider.AWS:
-            config.update({
-                "instance_type": flavor_config["instance_type"],
-                "ami": "ami-0c02fb55956c7d316"  # Amazon Linux 2
-            })
-        elif provider == Provider.AZURE:
-            config.update({
-                "size": flavor_config["size"],
-                "resource_group": "rg-default",
-                "image": "UbuntuLTS"
-            })
-        elif provider == Provider.GCP:
-            config.update({
-                "machine_type": flavor_config["machine_type"],
-                "project": "default-project"
-            })
-        elif provider == Provider.ONPREMISE:
-            config.update({
-                "cpu": flavor_config["vcpus"],
-                "ram": flavor_config["memory_gb"],
-                "hypervisor": "vmware"
-            })
+        config.update(_VM_EXTRA[provider](vm_type, flavor_config))
         
         # Aplicar overrides personalizados
         if custom_overrides:
             config.update(custom_overrides)
+            # Los overrides vienen del usuario: se validan
+            return VirtualMachineConfig(**config)
         
-        return VirtualMachineConfig(**config)
+        return VirtualMachineConfig.model_construct(**config)
     
     def _build_network_config(
         self, 
@@ -246,32 +387,9 @@ class VMDirector:
             "public_ip": True
         }
         
-        if provider == Provider.AWS:
-            config.update({
-                "vpc_id": f"vpc-{region.replace('-', '')}",
-                "subnet": f"subnet-{region.replace('-', '')}",
-                "security_group": f"sg-{vm_type.value}"
-            })
-        elif provider == Provider.AZURE:
-            config.update({
-                "virtual_network": f"vnet-{region}",
-                "subnet_name": f"subnet-{vm_type.value}",
-                "network_security_group": f"nsg-{vm_type.value}"
-            })
-        elif provider == Provider.GCP:
-            config.update({
-                "network_name": "default",
-                "subnetwork_name": f"subnet-{region}",
-                "firewall_tag": f"allow-{vm_type.value}"
-            })
-        elif provider == Provider.ONPREMISE:
-            config.update({
-                "physical_interface": "eth0",
-                "vlan_id": 100,
-                "firewall_policy": f"policy-{vm_type.value}"
-            })
+        config.update(_NETWORK_EXTRA[provider](region, vm_type))
         
-        return NetworkConfig(**config)
+        return NetworkConfig.model_construct(**config)
     
     def _build_storage_config(
         self, 
@@ -281,53 +399,16 @@ class VMDirector:
     ) -> StorageConfig:
         """Construye la configuración de almacenamiento según el proveedor y tipo"""
         
-        # Tamaño base según tipo de VM
-        base_size = {
-            VMType.STANDARD: 50,
-            VMType.MEMORY_OPTIMIZED: 100,
-            VMType.COMPUTE_OPTIMIZED: 30
-        }
-        
         config = {
             "region": region,
-            "size_gb": base_size[vm_type],
+            "size_gb": _BASE_STORAGE_SIZE_GB[vm_type],
             "iops": 3000 if vm_type == VMType.COMPUTE_OPTIMIZED else 1000
         }
         
-        if provider == Provider.AWS:
-            config.update({
-                "volume_type": "gp3" if vm_type == VMType.COMPUTE_OPTIMIZED else "gp2",
-                "encrypted": True
-            })
-        elif provider == Provider.AZURE:
-            config.update({
-                "disk_sku": "Premium_LRS" if vm_type == VMType.MEMORY_OPTIMIZED else "Standard_LRS",
-                "managed_disk": True
-            })
-        elif provider == Provider.GCP:
-            config.update({
-                "disk_type": "pd-ssd" if vm_type == VMType.COMPUTE_OPTIMIZED else "pd-standard",
-                "auto_delete": True
-            })
-        elif provider == Provider.ONPREMISE:
-            config.update({
-                "storage_pool": f"pool-{vm_type.value}",
-                "raid_level": "raid1"
-            })
+        config.update(_STORAGE_EXTRA[provider](vm_type))
         
-        return StorageConfig(**config)
+        return StorageConfig.model_construct(**config)
     
     def get_available_vm_types(self, provider: Provider) -> Dict[VMType, Dict[str, Any]]:
-        """Obtiene los tipos de VM disponibles para un proveedor"""
-        if provider not in self._vm_specifications:
-            return {}
-        
-        result = {}
-        for vm_type, spec in self._vm_specifications[provider].items():
-            result[vm_type] = {
-                "flavors": list(spec["flavors"].keys()),
-                "default_flavor": spec["default_flavor"],
-                "configurations": spec["flavors"]
-            }
-        
-        return result
\ No newline at end of file
+        """Obtiene los tipos de VM disponibles para un proveedor (resultado compartido, de solo lectura)"""
+        return _AVAILABLE_VM_TYPES.get(provider, {})
@@ -4,14 +4,18 @@ Permite clonar configuraciones predefinidas y personalizarlas según necesidades
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from copy import deepcopy
+from functools import cached_property, lru_cache
+from threading import Lock
+from typing import Dict, Any, List, Optional, Tuple
 import json
 from models_extended import (
     VMSpecification, VirtualMachineConfig, NetworkConfig, StorageConfig,
     VMType, Provider
 )
-from logger import safe_log
+from logger import log_enabled, safe_log
+
+# Protege el contador de clonaciones: los prototipos del registry se clonan desde varios hilos
+_creation_count_lock = Lock()
 
 
 class VMPrototype(ABC):
@@ -62,28 +66,33 @@ class ConcreteVMPrototype(VMPrototype):
         self.tags = tags or {}
         self.creation_count = 0  # Contador de veces que se ha clonado
         
-        safe_log(f"Prototype: Template '{template_name}' creado", {
-            "category": category,
-            "provider": vm_specification.provider,
-            "vm_type": vm_specification.vm_type
-        })
+        if log_enabled():
+            safe_log(f"Prototype: Template '{template_name}' creado", {
+                "category": category,
+                "provider": vm_specification.provider,
+                "vm_type": vm_specification.vm_type
+            })
     
     def clone(self) -> 'ConcreteVMPrototype':
         """
-        Crea una copia profunda del prototipo.
-        Utiliza deepcopy para evitar referencias compartidas.
+        Crea una copia independiente del prototipo.
+        Copia cada modelo con model_copy (sin revalidar) y duplica solo
+        los contenedores mutables para evitar referencias compartidas.
         """
-        safe_log(f"Prototype: Clonando template '{self.template_name}'", {})
-        
-        # Realizar copia profunda de la especificación
-        cloned_spec = VMSpecification(
-            vm_type=self.vm_specification.vm_type,
-            provider=self.vm_specification.provider,
-            region=self.vm_specification.region,
-            vm_config=VirtualMachineConfig(**self.vm_specification.vm_config.model_dump()),
-            network_config=NetworkConfig(**self.vm_specification.network_config.model_dump()),
-            storage_config=StorageConfig(**self.vm_specification.storage_config.model_dump())
-        )
+        if log_enabled():
+            safe_log(f"Prototype: Clonando template '{self.template_name}'", {})
+        
+        # Copiar la especificación; los valores ya fueron validados en el original
+        spec = self.vm_specification
+        network_config = spec.network_config
+        firewall_rules = network_config.firewall_rules
+        cloned_spec = spec.model_copy(update={
+            "vm_config": spec.vm_config.model_copy(),
+            "network_config": network_config.model_copy(update={
+                "firewall_rules": list(firewall_rules) if firewall_rules is not None else None
+            }),
+            "storage_config": spec.storage_config.model_copy()
+        })
         
         # Crear nuevo prototipo con la especificación clonada
         cloned_prototype = ConcreteVMPrototype(
@@ -91,11 +100,12 @@ class ConcreteVMPrototype(VMPrototype):
             description=self.description,
             vm_specification=cloned_spec,
             category=self.category,
-            tags=deepcopy(self.tags)
+            tags=dict(self.tags)
         )
         
         # Incrementar contador del prototipo original
-        self.creation_count += 1
+        with _creation_count_lock:
+            self.creation_count += 1
         
         return cloned_prototype
     
@@ -104,28 +114,16 @@ class ConcreteVMPrototype(VMPrototype):
         Personaliza el prototipo con parámetros específicos.
         Permite modificar VM, red y almacenamiento de forma granular.
         """
-        safe_log(f"Prototype: Personalizando template '{self.template_name}'", customizations)
+        if log_enabled():
+            safe_log(f"Prototype: Personalizando template '{self.template_name}'", customizations)
         
-        # Personalizar configuración de VM
-        if "vm_config" in customizations:
-            vm_updates = customizations["vm_config"]
-            current_config = self.vm_specification.vm_config.model_dump()
-            current_config.update(vm_updates)
-            self.vm_specification.vm_config = VirtualMachineConfig(**current_config)
-        
-        # Personalizar configuración de red
-        if "network_config" in customizations:
-            network_updates = customizations["network_config"]
-            current_config = self.vm_specification.network_config.model_dump()
-            current_config.update(network_updates)
-            self.vm_specification.network_config = NetworkConfig(**current_config)
-        
-        # Personalizar configuración de almacenamiento
-        if "storage_config" in customizations:
-            storage_updates = customizations["storage_config"]
-            current_config = self.vm_specification.storage_config.model_dump()
-            current_config.update(storage_updates)
-            self.vm_specification.storage_config = StorageConfig(**current_config)
+        # Personalizar VM, red y almacenamiento: una sola validación por sección,
+        # partiendo de los campos actuales sin serializar modelos anidados
+        spec = self.vm_specification
+        for section in ("vm_config", "network_config", "storage_config"):
+            if section in customizations:
+                current = getattr(spec, section)
+                setattr(spec, section, type(current)(**{**dict(current), **customizations[section]}))
         
         # Personalizar metadatos del template
         if "region" in customizations:
@@ -135,14 +133,18 @@ class ConcreteVMPrototype(VMPrototype):
         if "tags" in customizations:
             self.tags.update(customizations["tags"])
         
+        # La información descriptiva cacheada ya no refleja la especificación
+        self.__dict__.pop("_base_template_info", None)
+        
         return self
     
     def get_vm_specification(self) -> VMSpecification:
         """Retorna la especificación actual de la VM"""
         return self.vm_specification
     
-    def get_template_info(self) -> Dict[str, Any]:
-        """Retorna información descriptiva del template"""
+    @cached_property
+    def _base_template_info(self) -> Dict[str, Any]:
+        """Información descriptiva del template; se construye una vez y se invalida en customize()"""
         return {
             "template_name": self.template_name,
             "description": self.description,
@@ -151,7 +153,7 @@ class ConcreteVMPrototype(VMPrototype):
             "vm_type": self.vm_specification.vm_type,
             "region": self.vm_specification.region,
             "tags": self.tags,
-            "creation_count": self.creation_count,
+            "creation_count": 0,
             "specifications": {
                 "vcpus": self.vm_specification.vm_config.vcpus,
                 "memory_gb": self.vm_specification.vm_config.memory_gb,
@@ -159,6 +161,142 @@ class ConcreteVMPrototype(VMPrototype):
                 "network_type": getattr(self.vm_specification.network_config, 'network_type', 'standard')
             }
         }
+    
+    def get_template_info(self) -> Dict[str, Any]:
+        """Retorna información descriptiva del template"""
+        info = self._base_template_info.copy()
+        # Copia del dict anidado: el llamador puede modificarlo sin alterar la caché
+        info["specifications"] = info["specifications"].copy()
+        # creation_count cambia con cada clonación; se actualiza en cada lectura
+        info["creation_count"] = self.creation_count
+        return info
+
+
+@lru_cache(maxsize=None)
+def _default_prototypes() -> Tuple[Tuple[str, ConcreteVMPrototype], ...]:
+    """
+    Construye una sola vez los prototipos predeterminados.
+    Cada PrototypeRegistry registra clones de estos, sin revalidar las especificaciones.
+    """
+    # Template 1: Web Server Standard
+    web_server_spec = VMSpecification(
+        vm_type=VMType.STANDARD,
+        provider=Provider.AWS,
+        region="us-east-1",
+        vm_config=VirtualMachineConfig(
+            provider=Provider.AWS,
+            vcpus=2,
+            memory_gb=4,
+            instance_type="t3.medium",
+            ami="ami-0c02fb55956c7d316",
+            key_pair_name="web-server-key"
+        ),
+        network_config=NetworkConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            firewall_rules=["HTTP", "HTTPS", "SSH"],
+            public_ip=True,
+            network_type="public"
+        ),
+        storage_config=StorageConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            size_gb=20,
+            storage_type="gp3",
+            iops=3000
+        )
+    )
+    
+    web_server_template = ConcreteVMPrototype(
+        template_name="web-server-standard",
+        description="Servidor web estándar con balanceador de carga y almacenamiento optimizado",
+        vm_specification=web_server_spec,
+        category="web-services",
+        tags={"purpose": "web-server", "tier": "frontend", "environment": "production"}
+    )
+    
+    # Template 2: Database Server
+    db_server_spec = VMSpecification(
+        vm_type=VMType.MEMORY_OPTIMIZED,
+        provider=Provider.AWS,
+        region="us-east-1",
+        vm_config=VirtualMachineConfig(
+            provider=Provider.AWS,
+            vcpus=4,
+            memory_gb=32,
+            memory_optimization=True,
+            instance_type="r5.xlarge",
+            ami="ami-0c02fb55956c7d316",
+            key_pair_name="db-server-key"
+        ),
+        network_config=NetworkConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            firewall_rules=["MySQL", "PostgreSQL", "SSH"],
+            public_ip=False,
+            network_type="private"
+        ),
+        storage_config=StorageConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            size_gb=100,
+            storage_type="io2",
+            iops=10000,
+            encrypted=True
+        )
+    )
+    
+    db_server_template = ConcreteVMPrototype(
+        template_name="database-optimized",
+        description="Servidor de base de datos optimizado para memoria con almacenamiento de alto rendimiento",
+        vm_specification=db_server_spec,
+        category="databases",
+        tags={"purpose": "database", "tier": "backend", "performance": "high"}
+    )
+    
+    # Template 3: Analytics/Compute
+    analytics_spec = VMSpecification(
+        vm_type=VMType.COMPUTE_OPTIMIZED,
+        provider=Provider.AWS,
+        region="us-east-1",
+        vm_config=VirtualMachineConfig(
+            provider=Provider.AWS,
+            vcpus=16,
+            memory_gb=16,
+            disk_optimization=True,
+            instance_type="c5.4xlarge",
+            ami="ami-0c02fb55956c7d316",
+            key_pair_name="compute-key"
+        ),
+        network_config=NetworkConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            firewall_rules=["SSH", "Custom-8080"],
+            public_ip=True,
+            network_type="public"
+        ),
+        storage_config=StorageConfig(
+            provider=Provider.AWS,
+            region="us-east-1",
+            size_gb=200,
+            storage_type="gp3",
+            iops=5000
+        )
+    )
+    
+    analytics_template = ConcreteVMPrototype(
+        template_name="analytics-compute",
+        description="Servidor optimizado para procesamiento y análisis de datos intensivo",
+        vm_specification=analytics_spec,
+        category="analytics",
+        tags={"purpose": "analytics", "workload": "compute-intensive", "scale": "horizontal"}
+    )
+    
+    return (
+        ("web-server-standard", web_server_template),
+        ("database-optimized", db_server_template),
+        ("analytics-compute", analytics_template),
+    )
 
 
 class PrototypeRegistry:
@@ -169,7 +307,8 @@ class PrototypeRegistry:
     
     def __init__(self):
         self._prototypes: Dict[str, VMPrototype] = {}
-        self._categories: Dict[str, list[str]] = {}
+        # Nombres por categoría; un dict con valores None actúa como conjunto ordenado
+        self._categories: Dict[str, Dict[str, None]] = {}
         self._initialize_default_templates()
     
     def register(self, name: str, prototype: VMPrototype) -> bool:
@@ -193,9 +332,7 @@ class PrototypeRegistry:
         template_info = prototype.get_template_info()
         category = template_info.get("category", "general")
         
-        if category not in self._categories:
-            self._categories[category] = []
-        self._categories[category].append(name)
+        self._categories.setdefault(category, {})[name] = None
         
         safe_log(f"PrototypeRegistry: Template '{name}' registrado en categoría '{category}'", {})
         return True
@@ -227,8 +364,8 @@ class PrototypeRegistry:
         Returns:
             VMPrototype personalizado o None si el template no existe
         """
-        prototype = self.get_prototype(name)
-        if not prototype:
+        prototype = self._prototypes.get(name)
+        if prototype is None:
             safe_log(f"PrototypeRegistry: Template '{name}' no encontrado", {"level": "error"})
             return None
         
@@ -239,6 +376,30 @@ class PrototypeRegistry:
         
         return cloned
     
+    def clone_and_customize_many(
+        self,
+        name: str,
+        customizations_list: List[Optional[Dict[str, Any]]]
+    ) -> Optional[List[VMPrototype]]:
+        """
+        Clona un prototipo varias veces, aplicando a cada copia sus personalizaciones.
+        
+        Args:
+            name: Nombre del template a clonar
+            customizations_list: Personalizaciones de cada copia (None o {} para una copia sin cambios)
+            
+        Returns:
+            Lista de VMPrototype en el mismo orden, o None si el template no existe
+        """
+        clones = []
+        for customizations in customizations_list:
+            cloned = self.clone_and_customize(name, customizations)
+            if cloned is None:
+                return None
+            clones.append(cloned)
+        
+        return clones
+    
     def list_templates(self, category: str = None) -> Dict[str, Any]:
         """
         Lista todos los templates disponibles, opcionalmente filtrados por categoría.
@@ -249,18 +410,15 @@ class PrototypeRegistry:
         Returns:
             Dict con información de templates disponibles
         """
-        if category and category not in self._categories:
-            return {"templates": [], "total": 0}
+        if category:
+            template_names = self._categories.get(category)
+            if template_names is None:
+                return {"templates": [], "total": 0}
+            prototypes = [self._prototypes[name] for name in template_names]
+        else:
+            prototypes = list(self._prototypes.values())
         
-        template_names = (
-            self._categories[category] if category 
-            else list(self._prototypes.keys())
-        )
-        
-        templates = []
-        for name in template_names:
-            prototype = self._prototypes[name]
-            templates.append(prototype.get_template_info())
+        templates = [prototype.get_template_info() for prototype in prototypes]
         
         return {
             "templates": templates,
@@ -278,22 +436,20 @@ class PrototypeRegistry:
         Returns:
             bool: True si se eliminó, False si no existía
         """
-        if name not in self._prototypes:
+        # Eliminar del registry principal con una sola búsqueda
+        prototype = self._prototypes.pop(name, None)
+        if prototype is None:
             return False
         
-        # Obtener categoría antes de eliminar
-        template_info = self._prototypes[name].get_template_info()
-        category = template_info.get("category", "general")
-        
-        # Eliminar del registry principal
-        del self._prototypes[name]
+        category = prototype.get_template_info().get("category", "general")
         
         # Eliminar de la categoría
-        if category in self._categories and name in self._categories[category]:
-            self._categories[category].remove(name)
+        names = self._categories.get(category)
+        if names is not None:
+            names.pop(name, None)
             
             # Si la categoría queda vacía, eliminarla
-            if not self._categories[category]:
+            if not names:
                 del self._categories[category]
         
         safe_log(f"PrototypeRegistry: Template '{name}' eliminado", {})
@@ -301,125 +457,8 @@ class PrototypeRegistry:
     
     def _initialize_default_templates(self):
         """Inicializa templates predeterminados para casos de uso comunes"""
-        
-        # Template 1: Web Server Standard
-        web_server_spec = VMSpecification(
-            vm_type=VMType.STANDARD,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=2,
-                memory_gb=4,
-                instance_type="t3.medium",
-                ami="ami-0c02fb55956c7d316",
-                key_pair_name="web-server-key"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["HTTP", "HTTPS", "SSH"],
-                public_ip=True,
-                network_type="public"
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=20,
-                storage_type="gp3",
-                iops=3000
-            )
-        )
-        
-        web_server_template = ConcreteVMPrototype(
-            template_name="web-server-standard",
-            description="Servidor web estándar con balanceador de carga y almacenamiento optimizado",
-            vm_specification=web_server_spec,
-            category="web-services",
-            tags={"purpose": "web-server", "tier": "frontend", "environment": "production"}
-        )
-        
-        # Template 2: Database Server
-        db_server_spec = VMSpecification(
-            vm_type=VMType.MEMORY_OPTIMIZED,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=4,
-                memory_gb=32,
-                memory_optimization=True,
-                instance_type="r5.xlarge",
-                ami="ami-0c02fb55956c7d316",
-                key_pair_name="db-server-key"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["MySQL", "PostgreSQL", "SSH"],
-                public_ip=False,
-                network_type="private"
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=100,
-                storage_type="io2",
-                iops=10000,
-                encrypted=True
-            )
-        )
-        
-        db_server_template = ConcreteVMPrototype(
-            template_name="database-optimized",
-            description="Servidor de base de datos optimizado para memoria con almacenamiento de alto rendimiento",
-            vm_specification=db_server_spec,
-            category="databases",
-            tags={"purpose": "database", "tier": "backend", "performance": "high"}
-        )
-        
-        # Template 3: Analytics/Compute
-        analytics_spec = VMSpecification(
-            vm_type=VMType.COMPUTE_OPTIMIZED,
-            provider=Provider.AWS,
-            region="us-east-1",
-            vm_config=VirtualMachineConfig(
-                provider=Provider.AWS,
-                vcpus=16,
-                memory_gb=16,
-                disk_optimization=True,
-                instance_type="c5.4xlarge",
-                ami="ami-0c02fb55956c7d316",
-                key_pair_name="compute-key"
-            ),
-            network_config=NetworkConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                firewall_rules=["SSH", "Custom-8080"],
-                public_ip=True,
-                network_type="public"
-            ),
-            storage_config=StorageConfig(
-                provider=Provider.AWS,
-                region="us-east-1",
-                size_gb=200,
-                storage_type="gp3",
-                iops=5000
-            )
-        )
-        
-        analytics_template = ConcreteVMPrototype(
-            template_name="analytics-compute",
-            description="Servidor optimizado para procesamiento y análisis de datos intensivo",
-            vm_specification=analytics_spec,
-            category="analytics",
-            tags={"purpose": "analytics", "workload": "compute-intensive", "scale": "horizontal"}
-        )
-        
-        # Registrar templates predeterminados
-        self.register("web-server-standard", web_server_template)
-        self.register("database-optimized", db_server_template)
-        self.register("analytics-compute", analytics_template)
+        for name, prototype in _default_prototypes():
+            self.register(name, prototype.clone())
         
         safe_log("PrototypeRegistry: Templates predeterminados inicializados", {
             "total_templates": len(self._prototypes),
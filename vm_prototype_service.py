@@ -3,6 +3,10 @@ Servicio de gestión de prototipos de VM que integra el patrón Prototype
 con los patrones existentes (Factory Method, Abstract Factory, Builder+Director).
 """
 
+import heapq
+from collections import Counter
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 from models_extended import (
     VMSpecification, BuilderResponse, VMType, Provider
@@ -10,8 +14,32 @@ from models_extended import (
 from vm_prototype import PrototypeRegistry, VMPrototype, ConcreteVMPrototype
 from vm_construction_service import VMConstructionService
 from vm_director import VMDirector
-from vm_builder import ConcreteVMBuilder
-from logger import safe_log
+from logger import log_enabled, safe_log
+
+# str() de los enums calculado una sola vez al importar
+_PROVIDER_STR = MappingProxyType({provider: str(provider) for provider in Provider})
+_VM_TYPE_STR = MappingProxyType({vm_type: str(vm_type) for vm_type in VMType})
+
+# Tags automáticos de templates creados desde VMs existentes, por (proveedor, tipo de VM)
+_AUTO_TAGS = MappingProxyType({
+    (provider, vm_type): MappingProxyType({
+        "source": "existing_vm",
+        "provider": _PROVIDER_STR[provider],
+        "vm_type": _VM_TYPE_STR[vm_type],
+        "created_from": "production_vm"
+    })
+    for provider in Provider
+    for vm_type in VMType
+})
+
+
+def _copy_dump(value: Any) -> Any:
+    """Copia los dicts y listas de un model_dump(); los valores escalares son inmutables"""
+    if isinstance(value, dict):
+        return {key: _copy_dump(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_dump(item) for item in value]
+    return value
 
 
 class VMPrototypeService:
@@ -24,6 +52,11 @@ class VMPrototypeService:
         self.prototype_registry = PrototypeRegistry()
         self.construction_service = VMConstructionService()
         self.director = VMDirector()
+        # Proveedores compatibles por (proveedor propio, tipo de VM), calculados una sola vez:
+        # la adaptación solo falla si el Director no define ese tipo para el proveedor destino
+        self._compat_matrix = self._build_compatibility_matrix()
+        # Especificación serializada por template: (prototipo, model_dump()) de solo lectura
+        self._dump_cache: Dict[str, tuple] = {}
         safe_log("VMPrototypeService: Servicio inicializado", {})
     
     def create_from_template(
@@ -45,11 +78,12 @@ class VMPrototypeService:
         Returns:
             BuilderResponse con el resultado de la creación
         """
-        safe_log(f"PrototypeService: Creando VM desde template '{template_name}'", {
-            "provider": provider,
-            "region": region,
-            "has_customizations": bool(customizations)
-        })
+        if log_enabled():
+            safe_log(f"PrototypeService: Creando VM desde template '{template_name}'", {
+                "provider": provider,
+                "region": region,
+                "has_customizations": bool(customizations)
+            })
         
         try:
             # 1. Obtener y clonar el prototipo
@@ -59,7 +93,7 @@ class VMPrototypeService:
             )
             
             if not cloned_prototype:
-                return BuilderResponse(
+                return BuilderResponse.model_construct(
                     success=False,
                     error=f"Template '{template_name}' no encontrado"
                 )
@@ -76,29 +110,32 @@ class VMPrototypeService:
                 vm_spec.network_config.region = region
                 vm_spec.storage_config.region = region
             
-            # 4. Usar el builder para crear los recursos reales
-            builder = ConcreteVMBuilder()
-            result = (builder
-                     .set_vm_config(vm_spec.vm_config)
-                     .set_network_config(vm_spec.network_config)
-                     .set_storage_config(vm_spec.storage_config)
-                     .build())
+            # 4. Usar un builder del pool del servicio de construcción para crear los recursos
+            builder = self.construction_service.acquire_builder()
+            try:
+                result = (builder
+                         .set_vm_config(vm_spec.vm_config)
+                         .set_network_config(vm_spec.network_config)
+                         .set_storage_config(vm_spec.storage_config)
+                         .build())
+            finally:
+                self.construction_service.release_builder(builder)
             
             if result["success"]:
-                return BuilderResponse(
+                return BuilderResponse.model_construct(
                     success=True,
                     vm_specification=vm_spec,
                     created_resources=result["resources"]
                 )
             else:
-                return BuilderResponse(
+                return BuilderResponse.model_construct(
                     success=False,
                     error=result["error"]
                 )
                 
         except Exception as e:
-            safe_log(f"PrototypeService: Error creando desde template", {"error": str(e), "level": "error"})
-            return BuilderResponse(
+            safe_log("PrototypeService: Error creando desde template", {"error": str(e), "level": "error"})
+            return BuilderResponse.model_construct(
                 success=False,
                 error=f"Error interno: {str(e)}"
             )
@@ -124,10 +161,48 @@ class VMPrototypeService:
         Returns:
             Dict con resultado de la operación
         """
-        safe_log(f"PrototypeService: Registrando template '{template_name}'", {
-            "category": category,
-            "provider": vm_specification.provider
-        })
+        return self._register_one(template_name, vm_specification, description, category, tags)
+    
+    def register_templates(self, templates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Registra varios templates en una sola llamada.
+        
+        Args:
+            templates: Lista de dicts con los mismos parámetros que register_template
+            
+        Returns:
+            Lista con el resultado de cada registro, en el mismo orden
+        """
+        if log_enabled():
+            safe_log("PrototypeService: Registrando templates en lote", {"total": len(templates)})
+        
+        results = []
+        for template in templates:
+            try:
+                results.append(self._register_one(**template))
+            except TypeError as e:
+                # Parámetros faltantes o desconocidos: solo falla este elemento
+                safe_log("PrototypeService: Error registrando template", {"error": str(e), "level": "error"})
+                results.append({
+                    "success": False,
+                    "error": f"Error registrando template: {str(e)}"
+                })
+        return results
+    
+    def _register_one(
+        self,
+        template_name: str,
+        vm_specification: VMSpecification,
+        description: str,
+        category: str = "custom",
+        tags: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Crea el prototipo y lo registra; compartido por el registro individual y en lote"""
+        if log_enabled():
+            safe_log(f"PrototypeService: Registrando template '{template_name}'", {
+                "category": category,
+                "provider": vm_specification.provider
+            })
         
         try:
             prototype = ConcreteVMPrototype(
@@ -153,7 +228,7 @@ class VMPrototypeService:
                 }
                 
         except Exception as e:
-            safe_log(f"PrototypeService: Error registrando template", {"error": str(e), "level": "error"})
+            safe_log("PrototypeService: Error registrando template", {"error": str(e), "level": "error"})
             return {
                 "success": False,
                 "error": f"Error registrando template: {str(e)}"
@@ -169,13 +244,16 @@ class VMPrototypeService:
         Returns:
             Dict con lista de templates y metadata
         """
-        safe_log("PrototypeService: Listando templates disponibles", {"category": category})
+        if log_enabled():
+            safe_log("PrototypeService: Listando templates disponibles", {"category": category})
         
         try:
             templates_info = self.prototype_registry.list_templates(category)
             
-            # Enriquecer con estadísticas adicionales
-            templates_info["statistics"] = self._generate_template_statistics()
+            # Enriquecer con estadísticas globales; sin filtro, el listado ya las contiene todas
+            templates_info["statistics"] = self._generate_template_statistics(
+                None if category else templates_info
+            )
             
             return {
                 "success": True,
@@ -199,7 +277,8 @@ class VMPrototypeService:
         Returns:
             Dict con detalles del template o error
         """
-        safe_log(f"PrototypeService: Obteniendo detalles de '{template_name}'", {})
+        if log_enabled():
+            safe_log(f"PrototypeService: Obteniendo detalles de '{template_name}'", {})
         
         try:
             prototype = self.prototype_registry.get_prototype(template_name)
@@ -219,18 +298,31 @@ class VMPrototypeService:
             return {
                 "success": True,
                 "template_info": template_info,
-                "vm_specification": vm_spec.model_dump(),
+                "vm_specification": self._get_specification_dump(template_name, prototype),
                 "cost_estimate": cost_estimate,
                 "compatible_providers": self._get_compatible_providers(vm_spec)
             }
             
         except Exception as e:
-            safe_log(f"PrototypeService: Error obteniendo detalles", {"error": str(e), "level": "error"})
+            safe_log("PrototypeService: Error obteniendo detalles", {"error": str(e), "level": "error"})
             return {
                 "success": False,
                 "error": f"Error obteniendo detalles: {str(e)}"
             }
     
+    def _get_specification_dump(self, template_name: str, prototype: VMPrototype) -> Dict[str, Any]:
+        """
+        Serializa la especificación del template una sola vez y retorna una copia.
+        Los templates del registry no se modifican (se personalizan sus clones); la caché
+        se recalcula si el nombre apunta a otro prototipo. La copia evita que un llamador
+        altere la respuesta de los siguientes.
+        """
+        cached = self._dump_cache.get(template_name)
+        if cached is None or cached[0] is not prototype:
+            cached = (prototype, prototype.get_vm_specification().model_dump())
+            self._dump_cache[template_name] = cached
+        return _copy_dump(cached[1])
+    
     def delete_template(self, template_name: str) -> Dict[str, Any]:
         """
         Elimina un template del registry.
@@ -241,12 +333,14 @@ class VMPrototypeService:
         Returns:
             Dict con resultado de la operación
         """
-        safe_log(f"PrototypeService: Eliminando template '{template_name}'", {})
+        if log_enabled():
+            safe_log(f"PrototypeService: Eliminando template '{template_name}'", {})
         
         try:
             success = self.prototype_registry.remove_template(template_name)
             
             if success:
+                self._dump_cache.pop(template_name, None)
                 return {
                     "success": True,
                     "message": f"Template '{template_name}' eliminado exitosamente"
@@ -258,7 +352,7 @@ class VMPrototypeService:
                 }
                 
         except Exception as e:
-            safe_log(f"PrototypeService: Error eliminando template", {"error": str(e), "level": "error"})
+            safe_log("PrototypeService: Error eliminando template", {"error": str(e), "level": "error"})
             return {
                 "success": False,
                 "error": f"Error eliminando template: {str(e)}"
@@ -286,15 +380,11 @@ class VMPrototypeService:
         Returns:
             Dict con resultado de la operación
         """
-        safe_log(f"PrototypeService: Creando template desde VM existente '{template_name}'", {})
+        if log_enabled():
+            safe_log(f"PrototypeService: Creando template desde VM existente '{template_name}'", {})
         
-        # Agregar tags automáticos
-        auto_tags = {
-            "source": "existing_vm",
-            "provider": str(base_vm_spec.provider),
-            "vm_type": str(base_vm_spec.vm_type),
-            "created_from": "production_vm"
-        }
+        # Agregar tags automáticos (copia del dict precalculado)
+        auto_tags = dict(_AUTO_TAGS[(base_vm_spec.provider, base_vm_spec.vm_type)])
         
         if tags:
             auto_tags.update(tags)
@@ -312,83 +402,73 @@ class VMPrototypeService:
         Adapta una especificación de VM a un proveedor diferente.
         Utiliza el Director para obtener configuraciones equivalentes.
         """
-        safe_log(f"PrototypeService: Adaptando de {vm_spec.provider} a {target_provider}", {})
+        if log_enabled():
+            safe_log(f"PrototypeService: Adaptando de {vm_spec.provider} a {target_provider}", {})
         
         try:
-            # Usar el Director para obtener configuración equivalente
-            adapted_spec = self.director.get_vm_specification(
-                provider=target_provider,
-                vm_type=vm_spec.vm_type,
-                region=vm_spec.region,
-                custom_overrides={
-                    "vcpus": vm_spec.vm_config.vcpus,
-                    "memory_gb": vm_spec.vm_config.memory_gb
-                }
-            )
-            
-            return adapted_spec
+            return self._build_adapted_spec(vm_spec, target_provider)
             
         except Exception as e:
-            safe_log(f"PrototypeService: Error adaptando proveedor", {"error": str(e), "level": "error"})
+            safe_log("PrototypeService: Error adaptando proveedor", {"error": str(e), "level": "error"})
             # Si falla la adaptación, retornar la especificación original
             return vm_spec
     
-    def _generate_template_statistics(self) -> Dict[str, Any]:
-        """Genera estadísticas sobre los templates disponibles"""
-        all_templates = self.prototype_registry.list_templates()
+    def _build_adapted_spec(self, vm_spec: VMSpecification, target_provider: Provider) -> VMSpecification:
+        """
+        Usa el Director para obtener la configuración equivalente en otro proveedor.
+        Lanza ValueError (incluye errores de validación) si no es posible adaptarla.
+        """
+        return self.director.get_vm_specification(
+            provider=target_provider,
+            vm_type=vm_spec.vm_type,
+            region=vm_spec.region,
+            custom_overrides={
+                "vcpus": vm_spec.vm_config.vcpus,
+                "memory_gb": vm_spec.vm_config.memory_gb
+            }
+        )
+    
+    def _generate_template_statistics(self, all_templates: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Genera estadísticas sobre todos los templates, reutilizando el listado completo si se recibe"""
+        if all_templates is None:
+            all_templates = self.prototype_registry.list_templates()
+        
+        templates = all_templates["templates"]
+        
+        # Top 5 por uso en una sola pasada (mismo orden que sorted(..., reverse=True)[:5])
+        most_used = heapq.nlargest(5, templates, key=itemgetter("creation_count"))
         
         stats = {
             "total_templates": all_templates["total"],
             "categories": len(all_templates["categories"]),
-            "provider_distribution": {},
-            "vm_type_distribution": {},
-            "most_used_templates": []
+            "provider_distribution": dict(Counter(t["provider"] for t in templates)),
+            "vm_type_distribution": dict(Counter(t["vm_type"] for t in templates)),
+            "most_used_templates": [
+                {
+                    "name": template["template_name"],
+                    "usage_count": template["creation_count"],
+                    "category": template["category"]
+                }
+                for template in most_used
+            ]
         }
         
-        for template in all_templates["templates"]:
-            provider = template["provider"]
-            vm_type = template["vm_type"]
-            
-            # Distribución por proveedor
-            stats["provider_distribution"][provider] = (
-                stats["provider_distribution"].get(provider, 0) + 1
-            )
-            
-            # Distribución por tipo de VM
-            stats["vm_type_distribution"][vm_type] = (
-                stats["vm_type_distribution"].get(vm_type, 0) + 1
-            )
-            
-            # Templates más utilizados
-            stats["most_used_templates"].append({
-                "name": template["template_name"],
-                "usage_count": template["creation_count"],
-                "category": template["category"]
-            })
-        
-        # Ordenar por uso
-        stats["most_used_templates"].sort(
-            key=lambda x: x["usage_count"], 
-            reverse=True
-        )
-        stats["most_used_templates"] = stats["most_used_templates"][:5]  # Top 5
-        
         return stats
     
+    def _build_compatibility_matrix(self) -> Dict[tuple, tuple]:
+        """Precalcula, para cada (proveedor, tipo de VM), los proveedores a los que se puede adaptar"""
+        supported = {provider: self.director.get_available_vm_types(provider) for provider in Provider}
+        return {
+            (source, vm_type): tuple(
+                _PROVIDER_STR[target] for target in Provider
+                if target == source or vm_type in supported[target]
+            )
+            for source in Provider
+            for vm_type in VMType
+        }
+    
     def _get_compatible_providers(self, vm_spec: VMSpecification) -> List[str]:
         """
         Determina qué proveedores son compatibles con una especificación de VM.
         """
-        compatible = []
-        
-        for provider in Provider:
-            try:
-                # Intentar adaptar la especificación al proveedor
-                adapted_spec = self._adapt_to_provider(vm_spec, provider)
-                if adapted_spec:
-                    compatible.append(str(provider))
-            except:
-                # Si falla la adaptación, el proveedor no es compatible
-                continue
-        
-        return compatible
\ No newline at end of file
+        return list(self._compat_matrix[(vm_spec.provider, vm_spec.vm_type)])